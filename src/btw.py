@@ -10,13 +10,7 @@ import sys
 from datetime import date
 from pathlib import Path
 
-# Domain imports
 from src import cli_logging
-from src.config import load_config
-from src.entries import EntryProcessor
-from src.git import GitOperations
-from src.logs import LogManager
-from src.projects import ProjectFinder
 
 
 def add_manual_entry(entry_text: str):
@@ -25,6 +19,14 @@ def add_manual_entry(entry_text: str):
     Args:
         entry_text: Text for the manual entry
     """
+    # Domain imports are deferred so that argument errors in main() exit
+    # without loading the config, log and git machinery
+    from src.config import load_config
+    from src.entries import EntryProcessor
+    from src.git import GitOperations
+    from src.logs import LogManager
+    from src.projects import ProjectFinder
+
     # Load configuration
     config = load_config()
 
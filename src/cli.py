@@ -8,6 +8,7 @@ Provides setup and configuration commands for Captain's Log.
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 from . import __version__, cli_logging
 
@@ -43,6 +44,28 @@ fi
 """
 
 
+def _find_commit_msg_hook(package_dir: Path) -> Optional[Path]:
+    """Locate the commit-msg hook template shipped with the package.
+
+    Candidates are checked in order and the first existing one wins:
+    commit-msg-package (package installations), then commit-msg (installation
+    script), each next to the installed package and then next to this module
+    (when installed from a wheel).
+
+    Args:
+        package_dir: Directory of the installed ``src`` package
+
+    Returns:
+        Path to the hook template, or None if none was found
+    """
+    for base in dict.fromkeys((package_dir.parent, Path(__file__).parent.parent)):
+        for name in ("commit-msg-package", "commit-msg"):
+            candidate = base / name
+            if candidate.exists():
+                return candidate
+    return None
+
+
 def print_version():
     """Print the version information."""
     print(f"Captain's Log v{__version__}")
@@ -75,20 +98,8 @@ def setup():
     # Install commit-msg hook
     print("Installing Git commit-msg hook...")
 
-    # Look for commit-msg-package (for package installations) first
-    commit_msg_source = package_dir.parent / "commit-msg-package"
-    if not commit_msg_source.exists():
-        # Fall back to regular commit-msg (for installation script)
-        commit_msg_source = package_dir.parent / "commit-msg"
-    if not commit_msg_source.exists():
-        # Try alternate location (when installed from wheel)
-        commit_msg_source = Path(__file__).parent.parent / "commit-msg-package"
-    if not commit_msg_source.exists():
-        # Final fallback
-        commit_msg_source = Path(__file__).parent.parent / "commit-msg"
-
     commit_msg_dest = git_hooks_dir / "commit-msg"
-    if commit_msg_source.exists():
+    if _find_commit_msg_hook(package_dir) is not None:
         # Even if we have a hook template file, prefer generating a hook that
         # uses the current interpreter. This matters for pipx installs where
         # `python3` from PATH may not have `git-captains-log` installed.
@@ -1,20 +1,38 @@
 """Configuration loading functionality for Captain's Log."""
 
+import json
+import os
 from pathlib import Path
+from typing import Dict, Optional
 
 import yaml
 
 from .config_models import Config
 
+# Parse with libyaml when PyYAML was built with it; the pure-Python loader
+# accepts the same documents
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ConfigLoader:
-    """Handles loading and caching of Captain's Log configuration."""
+    """Handles loading and caching of Captain's Log configuration.
+
+    Besides the per-instance cache, the parsed YAML is stored in a JSON
+    sidecar next to the config file, keyed by the file's mtime and size, so
+    new processes (e.g. every commit-msg hook run) can skip YAML parsing.
+    """
 
     DEFAULT_CONFIG_PATH = Path.home() / ".captains-log" / "config.yml"
 
     def __init__(self, config_path: Path = None):
         """Initialize with optional custom config path."""
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
+        self.cache_path = self.config_path.with_name(
+            self.config_path.name + ".cache.json"
+        )
         self._cached_config = None
 
     def load_config(self, force_reload: bool = False) -> Config:
@@ -23,21 +41,88 @@ class ConfigLoader:
             return self._cached_config
 
         try:
-            if self.config_path.exists():
-                with open(self.config_path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-            else:
-                data = {}
-        except (OSError, yaml.YAMLError) as e:
+            stat_result = self.config_path.stat()
+        except FileNotFoundError:
+            data = {}
+        except OSError as e:
             print(f"Warning: Could not load config from {self.config_path}: {e}")
             data = {}
+        else:
+            cache_key = [stat_result.st_mtime_ns, stat_result.st_size]
+            data = self._read_sidecar(cache_key)
+            if data is None:
+                data = self._parse_config_file()
+                if data is not None:
+                    self._write_sidecar(cache_key, data)
+                else:
+                    data = {}
 
         self._cached_config = Config.from_dict(data)
         return self._cached_config
 
+    def _parse_config_file(self) -> Optional[Dict]:
+        """Parse the YAML config file.
+
+        Returns:
+            Parsed configuration data, or None if the file could not be read
+        """
+        try:
+            with open(self.config_path, encoding="utf-8") as f:
+                return yaml.load(f, Loader=_SafeLoader) or {}
+        except (OSError, yaml.YAMLError) as e:
+            print(f"Warning: Could not load config from {self.config_path}: {e}")
+            return None
+
+    def _read_sidecar(self, cache_key: list) -> Optional[Dict]:
+        """Read parsed config data from the JSON sidecar if it is current.
+
+        Args:
+            cache_key: [mtime_ns, size] of the config file
+
+        Returns:
+            Cached configuration data, or None if there is no usable cache
+        """
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("key") != cache_key:
+            return None
+        data = cached.get("data")
+        return data if isinstance(data, dict) else None
+
+    def _write_sidecar(self, cache_key: list, data: Dict):
+        """Store parsed config data in the JSON sidecar.
+
+        The sidecar is written atomically. Configs that do not round-trip
+        through JSON unchanged are not cached: json.dumps rejects values such
+        as YAML dates and silently turns int or bool keys into strings.
+
+        Args:
+            cache_key: [mtime_ns, size] of the config file
+            data: Parsed configuration data
+        """
+        temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            payload = json.dumps({"key": cache_key, "data": data})
+            if json.loads(payload)["data"] != data:
+                return
+            temp_path.write_text(payload, encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def clear_cache(self):
-        """Clear the cached configuration."""
+        """Clear the cached configuration, including the JSON sidecar."""
         self._cached_config = None
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Could not remove config cache {self.cache_path}: {e}")
 
 
 # Global default instance
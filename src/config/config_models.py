@@ -1,10 +1,37 @@
 """Configuration data models for Captain's Log."""
 
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Union
 
 
+@functools.lru_cache(maxsize=256)
+def _resolved_absolute(path: str) -> Path:
+    """Resolve an absolute path string, remembering the result."""
+    return Path(path).resolve()
+
+
+def resolved_path(path: Union[str, Path]) -> Path:
+    """Resolve a configured path to an absolute Path.
+
+    Absolute paths are memoized, so reloading the config does not walk the
+    filesystem again for every project. Relative paths depend on the current
+    working directory and are resolved on every call.
+
+    Args:
+        path: Path string from the config file, or a Path
+
+    Returns:
+        Resolved Path
+    """
+    path = os.fspath(path)
+    if os.path.isabs(path):
+        return _resolved_absolute(path)
+    return Path(path).resolve()
+
+
 @dataclass
 class ProjectConfig:
     """Configuration for a single project."""
@@ -17,14 +44,14 @@ class ProjectConfig:
         """Create ProjectConfig from dictionary or string."""
         if isinstance(data, str):
             # Simple string format: just the root path
-            return cls(root=Path(data).resolve() if data else None)
+            return cls(root=resolved_path(data) if data else None)
         elif isinstance(data, dict):
             # Dictionary format with explicit fields
             root = data.get("root")
             log_repo = data.get("log_repo")
             return cls(
-                root=Path(root).resolve() if root else None,
-                log_repo=Path(log_repo).resolve() if log_repo else None,
+                root=resolved_path(root) if root else None,
+                log_repo=resolved_path(log_repo) if log_repo else None,
             )
         else:
             return cls()
@@ -54,9 +81,7 @@ class Config:
             projects[name] = ProjectConfig.from_dict(project_data)
 
         return cls(
-            global_log_repo=Path(global_log_repo).resolve()
-            if global_log_repo
-            else None,
+            global_log_repo=resolved_path(global_log_repo) if global_log_repo else None,
             projects=projects,
         )
 
@@ -1,10 +1,15 @@
 """Entry data models for Captain's Log."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# Entries are created in bulk while rendering logs; drop the per-instance
+# __dict__ where the running Python supports slotted dataclasses (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class CommitEntry:
     """Represents a commit-based log entry."""
 
@@ -15,7 +20,7 @@ class CommitEntry:
     @property
     def short_sha(self) -> str:
         """Get the short version of the SHA (first 7 characters)."""
-        return self.sha[:7] if len(self.sha) >= 7 else self.sha
+        return self.sha[:7]
 
     def format(self) -> str:
         """Format the entry as a markdown list item."""
@@ -31,20 +36,19 @@ class CommitEntry:
         Returns:
             CommitEntry if parsing succeeds, None otherwise
         """
-        if not formatted_entry.startswith("- (") or ") " not in formatted_entry:
+        if not formatted_entry.startswith("- ("):
             return None
 
-        try:
-            sha_end = formatted_entry.find(")")
-            sha = formatted_entry[3:sha_end]
-            message = formatted_entry[sha_end + 2 :]
-
-            return cls(sha=sha, message=message, repo_name="")
-        except (ValueError, IndexError):
+        # The SHA runs up to the first closing parenthesis, which must be
+        # followed by a space; the message is everything after it
+        sha, sep, message = formatted_entry[3:].partition(") ")
+        if not sep or ")" in sha:
             return None
 
+        return cls(sha=sha, message=message, repo_name="")
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ManualEntry:
     """Represents a manually added log entry."""
 
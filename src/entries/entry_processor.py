@@ -27,21 +27,25 @@ class EntryProcessor:
             Updated list of entries
         """
         # Use short SHA (first 7 characters)
-        short_sha = new_sha[:7] if len(new_sha) >= 7 else new_sha
-
-        # Find entries with the same message but different SHA to remove
-        to_remove = []
-        for i, entry in enumerate(entries):
-            parsed = CommitEntry.parse(entry)
-            if parsed and parsed.message == new_message and parsed.sha != short_sha:
-                to_remove.append(i)
-            elif parsed and parsed.sha == short_sha and parsed.message == new_message:
-                # Exact match already exists, no need to add
-                return entries
-
-        # Remove outdated entries (in reverse order to maintain indices)
-        for i in reversed(to_remove):
-            entries.pop(i)
+        short_sha = new_sha[:7]
+
+        # Single pass: keep every entry except older commits with the same
+        # message. Only entries ending in the message can match, which skips
+        # parsing everything else
+        kept_entries = []
+        for entry in entries:
+            if entry.endswith(new_message):
+                parsed = CommitEntry.parse(entry)
+                if parsed and parsed.message == new_message:
+                    if parsed.sha == short_sha:
+                        # Exact match already exists, no need to add
+                        return entries
+                    continue
+            kept_entries.append(entry)
+
+        # Drop outdated entries in place, as callers may hold the same list
+        if len(kept_entries) != len(entries):
+            entries[:] = kept_entries
 
         # Add the new entry
         new_entry = self.formatter.format_commit_entry(new_sha, new_message)
@@ -80,11 +84,12 @@ class EntryProcessor:
         Returns:
             Ordered dictionary ready for output
         """
-        # Custom sorting with 'other' at the end
-        other_entries = repos.pop("other", None)
-        sorted_repos = dict(sorted(repos.items(), key=lambda x: x[0].lower()))
+        # Custom sorting with 'other' at the end; only the names are sorted
+        # and the input dictionary is left untouched
+        names = sorted((name for name in repos if name != "other"), key=str.lower)
+        sorted_repos = {name: repos[name] for name in names}
 
-        if other_entries is not None:
-            sorted_repos["other"] = other_entries
+        if "other" in repos:
+            sorted_repos["other"] = repos["other"]
 
         return sorted_repos
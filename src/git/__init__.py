@@ -1,6 +1,35 @@
-"""Git operations module for Captain's Log."""
+"""Git operations module for Captain's Log.
 
-from .commit_parser import CommitParser
-from .git_operations import GitOperations
+Submodules are imported lazily on first attribute access, so importing the
+package does not load ``subprocess`` or pygit2 until they are needed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .commit_parser import CommitParser
+    from .git_operations import GitOperations
+
+_LAZY_IMPORTS = {
+    "CommitParser": ".commit_parser",
+    "GitOperations": ".git_operations",
+}
 
 __all__ = ["GitOperations", "CommitParser"]
+
+
+def __getattr__(name):
+    """Import the submodule that defines ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,12 @@
 """Commit parsing utilities for Captain's Log."""
 
+import string
 from typing import Optional, Tuple
 
+from src.entries.entry_models import CommitEntry
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
 
 class CommitParser:
     """Handles parsing commit information and validation."""
@@ -10,19 +15,16 @@ class CommitParser:
     def is_valid_commit_sha(commit_sha: str) -> bool:
         """Check if a commit SHA is valid for logging.
 
+        Only hexadecimal object names are valid, which also rules out the
+        "no-sha" placeholders the commit hook passes when HEAD is unknown.
+
         Args:
             commit_sha: The commit SHA to validate
 
         Returns:
             True if the SHA is valid for logging, False otherwise
         """
-        if not commit_sha or commit_sha == "no-sha":
-            return False
-
-        if commit_sha.startswith("no-sha"):
-            return False
-
-        return True
+        return bool(commit_sha) and _HEX_DIGITS.issuperset(commit_sha)
 
     @staticmethod
     def parse_commit_entry(entry: str) -> Tuple[Optional[str], Optional[str]]:
@@ -34,16 +36,11 @@ class CommitParser:
         Returns:
             Tuple of (sha, message) or (None, None) if parsing fails
         """
-        if not entry.startswith("- (") or ") " not in entry:
+        parsed = CommitEntry.parse(entry)
+        if parsed is None:
             return None, None
 
-        try:
-            sha_end = entry.find(")")
-            sha = entry[3:sha_end]
-            message = entry[sha_end + 2 :]
-            return sha, message
-        except (ValueError, IndexError):
-            return None, None
+        return parsed.sha, parsed.message
 
     @staticmethod
     def should_skip_commit(
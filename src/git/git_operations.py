@@ -1,11 +1,28 @@
 """Git operations for Captain's Log."""
 
+import os
 import subprocess
+import tempfile
 from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - depends on the environment
+    pygit2 = None
 
 
 class GitOperations:
-    """Handles git operations for the log repository."""
+    """Handles git operations for the log repository.
+
+    When pygit2 is installed, status, staging and committing run in-process
+    through libgit2. Otherwise every operation shells out to ``git``.
+    """
+
+    # Exit codes of the commit_and_push_batched script, one per failing step
+    _BATCH_ADD_FAILED = 3
+    _BATCH_COMMIT_FAILED = 4
+    _BATCH_PUSH_FAILED = 5
 
     def __init__(self, repo_path: Path):
         """Initialize with repository path.
@@ -14,6 +31,33 @@ class GitOperations:
             repo_path: Path to the git repository
         """
         self.repo_path = repo_path
+        # Built once; every git invocation and lock check reuses them
+        self._repo_str = str(repo_path)
+        self._git_dir = Path(repo_path) / ".git"
+        self.repo = self._open_repository(repo_path)
+        self._signature = None
+        self._status_cache: Optional[bytes] = None
+        self._index_proc: Optional[subprocess.Popen] = None
+        self._index_stderr = None
+
+    @staticmethod
+    def _open_repository(repo_path: Path):
+        """Open the repository with pygit2 if it is available.
+
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            pygit2.Repository, or None when pygit2 is missing or the path
+            is not a valid repository
+        """
+        if pygit2 is None:
+            return None
+
+        try:
+            return pygit2.Repository(str(repo_path))
+        except (pygit2.GitError, KeyError, OSError):
+            return None
 
     def has_changes(self) -> bool:
         """Check if there are any uncommitted changes in the repository.
@@ -21,16 +65,68 @@ class GitOperations:
         Returns:
             True if there are changes, False otherwise
         """
+        if self.repo is not None:
+            try:
+                return bool(self._repo_status())
+            except pygit2.GitError:
+                return False
+
         try:
+            return bool(self._get_status())
+        except subprocess.CalledProcessError:
+            return False
+
+    def _repo_status(self) -> Dict[str, int]:
+        """Get libgit2 status flags per path, leaving out ignored files.
+
+        pygit2 releases before 1.15 report ignored files in status(), which
+        ``git status --porcelain`` never does.
+
+        Returns:
+            Mapping of path to status flags for every changed file
+        """
+        return {
+            file_path: flags
+            for file_path, flags in self.repo.status().items()
+            if flags & ~pygit2.GIT_STATUS_IGNORED
+        }
+
+    def _get_status(self, force: bool = False) -> bytes:
+        """Get ``git status --porcelain -z`` output, running git at most once.
+
+        The result is cached so that has_changes and add_all share a single
+        git invocation during commit_and_push. Untracked directories are
+        expanded into their files so callers only ever see file paths.
+
+        Args:
+            force: Re-run git status even if a cached result exists
+
+        Returns:
+            NUL-separated porcelain status records, as raw bytes
+
+        Raises:
+            subprocess.CalledProcessError: If git status fails
+        """
+        if self._status_cache is None or force:
             result = subprocess.run(
-                ["git", "-C", str(self.repo_path), "status", "--porcelain"],
-                capture_output=True,
-                text=True,
+                [
+                    "git",
+                    "-C",
+                    self._repo_str,
+                    "status",
+                    "--porcelain=v1",
+                    "-z",
+                    "--untracked-files=all",
+                ],
                 check=True,
+                capture_output=True,
             )
-            return bool(result.stdout.strip())
-        except subprocess.CalledProcessError:
-            return False
+            self._status_cache = result.stdout
+        return self._status_cache
+
+    def invalidate_status(self):
+        """Drop the cached git status so the next check runs git again."""
+        self._status_cache = None
 
     def has_lock_files(self) -> bool:
         """Check if there are any git lock files present.
@@ -38,13 +134,13 @@ class GitOperations:
         Returns:
             True if lock files exist, False otherwise
         """
-        git_dir = self.repo_path / ".git"
-        if not git_dir.exists():
+        try:
+            with os.scandir(self._git_dir) as entries:
+                return any(entry.name.endswith(".lock") for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            # No repository, or a .git file pointing elsewhere (worktrees)
             return False
 
-        lock_files = list(git_dir.glob("*.lock"))
-        return len(lock_files) > 0
-
     def add_file(self, file_path: Path) -> bool:
         """Add a file to the git staging area.
 
@@ -57,159 +153,231 @@ class GitOperations:
         try:
             relative_path = file_path.relative_to(self.repo_path)
             subprocess.run(
-                ["git", "-C", str(self.repo_path), "add", str(relative_path)],
+                ["git", "-C", self._repo_str, "add", str(relative_path)],
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return True
         except (subprocess.CalledProcessError, ValueError):
             return False
 
+    def open_session(self):
+        """Start a long-lived ``git update-index`` process for staging.
+
+        Meant for long-running callers that stage many files over time: each
+        add_path only writes to the process's stdin instead of starting a new
+        git. The one-shot methods remain the default for CLI use. Paths are
+        staged once the session is closed.
+
+        git's stderr goes to a temporary file rather than a pipe, so a long
+        session cannot stall on warnings nobody reads until close.
+        """
+        if self._index_proc is not None:
+            return
+
+        self._index_stderr = tempfile.TemporaryFile()
+        self._index_proc = subprocess.Popen(
+            [
+                "git",
+                "-C",
+                self._repo_str,
+                "update-index",
+                "--add",
+                "--remove",
+                "-z",
+                "--stdin",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self._index_stderr,
+        )
+
+    def add_path(self, file_path: Path) -> bool:
+        """Stage a file through the session opened by open_session.
+
+        Args:
+            file_path: Path to the file to add
+
+        Returns:
+            True if the path was queued, False otherwise
+        """
+        if self._index_proc is None:
+            return False
+
+        try:
+            relative_path = file_path.relative_to(self.repo_path)
+        except ValueError:
+            return False
+
+        try:
+            self._index_proc.stdin.write(str(relative_path).encode() + b"\0")
+            self._index_proc.stdin.flush()
+            return True
+        except OSError:
+            return False
+
+    def close(self) -> bool:
+        """Finish the staging session and wait for git to update the index.
+
+        Returns:
+            True if every queued path was staged (or no session was open),
+            False otherwise
+        """
+        if self._index_proc is None:
+            return True
+
+        proc, self._index_proc = self._index_proc, None
+        stderr_file, self._index_stderr = self._index_stderr, None
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        returncode = proc.wait()
+        self.invalidate_status()
+
+        with stderr_file:
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+                print(f"Error: git update-index failed: {stderr}")
+                return False
+        return True
+
     def add_all(self) -> bool:
         """Add all changes to the git staging area.
 
-        Safeguard: Only adds .md files and directories containing .md files
-        to prevent accidentally committing unwanted files.
+        Safeguard: Only adds .md files to prevent accidentally committing
+        unwanted files. git stages the parent directories of a file on its own.
 
         Note: git status --porcelain does NOT truncate output - it will return
-        all files regardless of count. However, we batch add files to avoid
-        command line length limits and improve performance with large file lists.
+        all files regardless of count. All paths are passed to one git add via
+        stdin, so the number of files is not limited by the command line length.
 
         Returns:
             True if successful, False otherwise
         """
+        if self.repo is not None:
+            return self._add_all_in_process()
+
         try:
             # Get list of changed files from git status
             # Note: git status --porcelain outputs all files (no truncation),
             # but subprocess.run with capture_output=True buffers all output in memory
-            status_result = subprocess.run(
-                ["git", "-C", str(self.repo_path), "status", "--porcelain"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            status_output = self._get_status()
 
-            if not status_result.stdout.strip():
+            if not status_output:
                 # No changes to add
                 return True
 
-            # Parse status output and filter to .md files and directories
-            paths_to_add = set()
-
-            for line in status_result.stdout.strip().split("\n"):
-                if not line.strip():
-                    continue
+            paths_to_add = self._collect_paths_to_add(status_output)
 
-                # Git status porcelain format: XY <path>
-                # X = index status, Y = working tree status (e.g. " M", "M ", "A ", "??", "R ").
-                # Strip leading/trailing whitespace and split once to get status and path.
-                parts = line.strip().split(maxsplit=1)
-                if len(parts) != 2:
-                    continue
-                status, file_path = parts
-                file_path = file_path.strip()
-
-                # Handle renamed files (format: "R  old -> new")
-                if "R" in status:
-                    parts = file_path.split(" -> ")
-                    if len(parts) == 2:
-                        old_path, new_path = parts
-                        # Add both old (for deletion) and new (for addition) if .md files
-                        if old_path.endswith(".md"):
-                            paths_to_add.add(old_path)
-                        if new_path.endswith(".md"):
-                            paths_to_add.add(new_path)
-                            # Also add parent directories if file is in a subdirectory
-                            new_path_obj = Path(self.repo_path) / new_path
-                            parent = new_path_obj.parent
-                            while parent != Path(self.repo_path):
-                                paths_to_add.add(
-                                    str(parent.relative_to(self.repo_path))
-                                )
-                                next_parent = parent.parent
-                                if next_parent == parent:  # Reached filesystem root
-                                    break
-                                parent = next_parent
-                    continue
-
-                # Check if it's a .md file
-                if file_path.endswith(".md"):
-                    paths_to_add.add(file_path)
-                    # If file is in a subdirectory, also add parent directories
-                    file_path_obj = Path(self.repo_path) / file_path
-                    parent = file_path_obj.parent
-                    while parent != Path(self.repo_path):
-                        paths_to_add.add(str(parent.relative_to(self.repo_path)))
-                        next_parent = parent.parent
-                        if next_parent == parent:  # Reached filesystem root
-                            break
-                        parent = next_parent
-                # Check if it's a directory (untracked directories show up without extension)
-                else:
-                    path_obj = Path(self.repo_path) / file_path
-                    if path_obj.is_dir():
-                        # Check if directory contains any .md files
-                        if any(f.suffix == ".md" for f in path_obj.rglob("*.md")):
-                            paths_to_add.add(file_path)
-
-            # Add all paths (files and directories)
+            # Add all paths
             if paths_to_add:
-                sorted_paths = sorted(paths_to_add)
-
-                # Batch add files to avoid too many individual git commands
-                # Git can handle adding multiple files at once, which is more efficient
-                # However, we need to be careful about command line length limits
-                # Typical limit is ~128KB on most systems, so we batch in chunks
-                MAX_ARGS_LENGTH = 100000  # Conservative limit (~100KB)
-                BATCH_SIZE = (
-                    100  # Process files in batches to avoid command line limits
-                )
-
-                # Process in batches to avoid command line length limits
-                for i in range(0, len(sorted_paths), BATCH_SIZE):
-                    batch = sorted_paths[i : i + BATCH_SIZE]
-                    # Estimate command length (rough approximation)
-                    cmd_length = (
-                        sum(len(str(p)) for p in batch) + 100
-                    )  # +100 for git command overhead
-
-                    if cmd_length > MAX_ARGS_LENGTH or len(batch) == 1:
-                        # Add individually if batch would be too long or only one file
-                        for path in batch:
-                            try:
-                                subprocess.run(
-                                    ["git", "-C", str(self.repo_path), "add", path],
-                                    check=True,
-                                    capture_output=True,
-                                    text=True,
-                                )
-                            except subprocess.CalledProcessError as e:
-                                print(
-                                    f"Error: git add failed for {path}: {e.stderr or e}"
-                                )
-                                raise
-                    else:
-                        # Batch add multiple files at once
-                        try:
-                            subprocess.run(
-                                ["git", "-C", str(self.repo_path), "add"] + batch,
-                                check=True,
-                                capture_output=True,
-                                text=True,
-                            )
-                        except subprocess.CalledProcessError as e:
-                            joined_paths = " ".join(batch)
-                            print(
-                                "Error: git add failed for batch "
-                                f"({joined_paths}): {e.stderr or e}"
-                            )
-                            raise
+                # Feed every path to a single git add through stdin. This avoids
+                # both command line length limits and one process per batch.
+                try:
+                    subprocess.run(
+                        [
+                            "git",
+                            "-C",
+                            self._repo_str,
+                            "add",
+                            "--pathspec-from-file=-",
+                            "--pathspec-file-nul",
+                        ],
+                        input=self._encode_paths(paths_to_add),
+                        check=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                    )
+                except subprocess.CalledProcessError as e:
+                    stderr = e.stderr.decode(errors="replace") if e.stderr else ""
+                    print(f"Error: git add failed: {stderr or e}")
+                    raise
 
             return True
         except subprocess.CalledProcessError:
             return False
 
+    @staticmethod
+    def _collect_paths_to_add(status_output: bytes) -> List[str]:
+        """Extract the .md paths to stage from ``git status --porcelain -z`` output.
+
+        With -z every record is ``XY <path>`` terminated by NUL, paths are
+        never quoted or escaped, and a rename or copy record is followed by
+        an extra record holding the original path.
+
+        Args:
+            status_output: NUL-separated porcelain status records
+
+        Returns:
+            Sorted list of .md paths relative to the repository root
+        """
+        paths_to_add = set()
+        records = iter(status_output.split(b"\0"))
+
+        for record in records:
+            # X = index status, Y = working tree status, then a space
+            if len(record) < 4:
+                continue
+            status, file_path = record[:2], record[3:]
+
+            # Renamed or copied files: "R  new\0old\0". A rename only shows up
+            # once it is staged, so the old path is already gone from the
+            # index and passing it to git add would fail; skip that record
+            if b"R" in status or b"C" in status:
+                next(records, None)
+
+            if file_path.endswith(b".md"):
+                paths_to_add.add(file_path)
+
+        return sorted(os.fsdecode(path) for path in paths_to_add)
+
+    @staticmethod
+    def _encode_paths(paths: List[str]) -> bytes:
+        """Encode paths for ``--pathspec-from-file=- --pathspec-file-nul``.
+
+        Args:
+            paths: Paths as returned by _collect_paths_to_add
+
+        Returns:
+            NUL-separated paths in the file system encoding
+        """
+        return b"\0".join(os.fsencode(path) for path in paths)
+
+    def _add_all_in_process(self) -> bool:
+        """Stage changed .md files through libgit2.
+
+        Each status entry already carries its path and flags, so renames show
+        up as a deleted old path plus a new path and no directory walking is
+        needed.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        worktree_changes = (
+            pygit2.GIT_STATUS_WT_NEW
+            | pygit2.GIT_STATUS_WT_MODIFIED
+            | pygit2.GIT_STATUS_WT_RENAMED
+            | pygit2.GIT_STATUS_WT_TYPECHANGE
+        )
+
+        try:
+            index = self.repo.index
+            for file_path, flags in self._repo_status().items():
+                if not file_path.endswith(".md"):
+                    continue
+                if flags & pygit2.GIT_STATUS_WT_DELETED:
+                    index.remove(file_path)
+                elif flags & worktree_changes:
+                    index.add(file_path)
+            index.write()
+            return True
+        except (pygit2.GitError, OSError) as e:
+            print(f"Error: git add failed: {e}")
+            return False
+
     def commit(self, message: str) -> bool:
         """Create a commit with the given message.
 
@@ -219,34 +387,121 @@ class GitOperations:
         Returns:
             True if successful, False otherwise
         """
+        if self.repo is not None:
+            return self._commit_in_process(message)
+
         try:
             subprocess.run(
-                ["git", "-C", str(self.repo_path), "commit", "-m", message],
+                ["git", "-C", self._repo_str, "commit", "-m", message],
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
+            self.invalidate_status()
             return True
         except subprocess.CalledProcessError:
             return False
 
+    def _commit_in_process(self, message: str) -> bool:
+        """Create a commit from the current index through libgit2.
+
+        Like ``git commit``, this refuses to create a commit when nothing is
+        staged.
+
+        Args:
+            message: Commit message
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            tree = self.repo.index.write_tree()
+            if self.repo.head_is_unborn:
+                parents = []
+            else:
+                parents = [self.repo.head.target]
+                if self.repo[parents[0]].tree_id == tree:
+                    return False
+
+            if self._signature is None:
+                self._signature = self.repo.default_signature
+            self.repo.create_commit(
+                "HEAD", self._signature, self._signature, message, tree, parents
+            )
+            return True
+        except (pygit2.GitError, KeyError):
+            return False
+
     def push(self) -> bool:
         """Push commits to the remote repository.
 
+        Pushing always goes through ``git`` so that the user's credential
+        helpers and SSH agent are honoured.
+
         Returns:
             True if successful, False otherwise
         """
         try:
             subprocess.run(
-                ["git", "-C", str(self.repo_path), "push"],
+                ["git", "-C", self._repo_str, "push"],
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
+            self.invalidate_status()
             return True
         except subprocess.CalledProcessError:
             return False
 
+    def commit_and_push_batched(self, paths: List[str], message: str) -> bool:
+        """Stage paths, commit and push with a single shell invocation.
+
+        The git calls are chained in one ``sh -c`` script so only one process
+        is spawned from Python. The repository path and message are passed as
+        positional arguments and the paths through stdin, so nothing is ever
+        interpolated into the script. Each step exits with its own code so
+        the failing step can still be reported.
+
+        Args:
+            paths: Paths to stage, relative to the repository root
+            message: Commit message
+
+        Returns:
+            True if successful, False otherwise
+        """
+        steps = []
+        if paths:
+            steps.append(
+                'git -C "$1" add --pathspec-from-file=- --pathspec-file-nul'
+                f" || exit {self._BATCH_ADD_FAILED}"
+            )
+        steps.append(f'git -C "$1" commit -m "$2" || exit {self._BATCH_COMMIT_FAILED}')
+        steps.append(f'git -C "$1" push || exit {self._BATCH_PUSH_FAILED}')
+
+        result = subprocess.run(
+            ["sh", "-c", "\n".join(steps), "sh", self._repo_str, message],
+            input=self._encode_paths(paths),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        stderr = result.stderr.decode(errors="replace") if result.stderr else ""
+        self.invalidate_status()
+
+        if result.returncode == 0:
+            print("Successfully committed and pushed log updates")
+            return True
+
+        if result.returncode == self._BATCH_ADD_FAILED:
+            print(f"Error: git add failed: {stderr}")
+            print("Warning: Failed to add files to git")
+        elif result.returncode == self._BATCH_COMMIT_FAILED:
+            print("Warning: Failed to commit changes")
+        elif result.returncode == self._BATCH_PUSH_FAILED:
+            print("Warning: Failed to push changes")
+        else:
+            print(f"Warning: Unexpected error during git operations: {stderr}")
+        return False
+
     def commit_and_push(self, commit_message: str) -> bool:
         """Perform the complete commit and push workflow.
 
@@ -256,6 +511,9 @@ class GitOperations:
         Returns:
             True if successful, False otherwise
         """
+        # Start from a fresh status; it is then shared by has_changes and add_all
+        self.invalidate_status()
+
         try:
             # Check for lock files
             if self.has_lock_files():
@@ -267,6 +525,11 @@ class GitOperations:
                 print("No changes to commit, skipping git operations")
                 return True
 
+            # Without pygit2, stage, commit and push in a single process
+            if self.repo is None:
+                paths = self._collect_paths_to_add(self._get_status())
+                return self.commit_and_push_batched(paths, commit_message)
+
             # Add all changes
             if not self.add_all():
                 print("Warning: Failed to add files to git")
@@ -1,8 +1,40 @@
-"""Log file operations module for Captain's Log."""
+"""Log file operations module for Captain's Log.
 
-from .log_manager import LogManager
-from .log_models import LogData, LogFileInfo
-from .log_parser import LogParser
-from .log_writer import LogWriter
+Submodules are imported lazily on first attribute access, so importing
+``LogData`` does not load the parser, writer and manager as well.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .log_manager import LogManager
+    from .log_models import LogData, LogFileInfo
+    from .log_parser import LogParser
+    from .log_writer import LogWriter
+
+_LAZY_IMPORTS = {
+    "LogData": ".log_models",
+    "LogFileInfo": ".log_models",
+    "LogParser": ".log_parser",
+    "LogWriter": ".log_writer",
+    "LogManager": ".log_manager",
+}
 
 __all__ = ["LogData", "LogFileInfo", "LogParser", "LogWriter", "LogManager"]
+
+
+def __getattr__(name):
+    """Import the submodule that defines ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,12 @@
 """Log management functionality for Captain's Log."""
 
-import re
+import json
+import os
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
-from src.config.config_models import Config
+from src.config.config_models import Config, resolved_path
 from src.logs.log_models import LogData, LogFileInfo
 from src.logs.log_parser import LogParser
 from src.logs.log_writer import LogWriter
@@ -16,7 +17,9 @@ class LogManager:
     """High-level log management operations."""
 
     BASE_DIR = Path.home() / ".captains-log" / "projects"
-    LOG_FILE_PATTERN = re.compile(r"^(\d{4})\.(\d{2})\.(\d{2})\.md$")
+    # Remembers which log directories were already organized in which month,
+    # so the archive scan runs at most once per month across CLI invocations
+    ORGANIZE_STATE_FILE = Path.home() / ".captains-log" / ".organize_state.json"
 
     def __init__(self, config: Config):
         """Initialize with configuration.
@@ -26,6 +29,7 @@ class LogManager:
         """
         self.config = config
         self.parser = LogParser()
+        self._organize_state: Optional[Dict[str, List[int]]] = None
 
     def get_log_file_info(
         self, project: ProjectInfo, log_date: Optional[date] = None
@@ -45,18 +49,22 @@ class LogManager:
         log_file_name = f"{log_date.year}.{log_date.month:02d}.{log_date.day:02d}.md"
         log_repo_path = project.log_repo or self.config.global_log_repo
 
-        # Organize old files - always check and organize files from previous months
-        base_dir = self._get_base_directory(project, log_repo_path)
-        if self._has_old_files_in_main_directory(project, log_repo_path):
-            self._organize_old_log_files(project, log_repo_path)
+        # Resolve once; the base directory and LogFileInfo both use it
+        resolved_log_repo_path = resolved_path(log_repo_path) if log_repo_path else None
+        base_dir = self._base_directory_for(project, resolved_log_repo_path)
+
+        # Organize old files - at most once per month per directory, move files
+        # from previous months. Old files added after that month's first run
+        # are archived on the first run of the next month.
+        if not self._was_organized_this_month(base_dir):
+            if self._has_old_files_in_main_directory(base_dir):
+                self._organize_old_log_files(base_dir)
+            if base_dir.exists():
+                self._mark_organized_this_month(base_dir)
 
         # Build the file path
-        base_dir = self._get_base_directory(project, log_repo_path)
         log_file_path = self._build_log_file_path(base_dir, log_file_name, log_date)
 
-        # Resolve log_repo_path if it exists
-        resolved_log_repo_path = log_repo_path.resolve() if log_repo_path else None
-
         return LogFileInfo(
             file_path=log_file_path,
             log_repo_path=resolved_log_repo_path,
@@ -73,20 +81,24 @@ class LogManager:
         Returns:
             LogData containing the parsed log
         """
+        # Current-month logs have no other location, and a missing file parses
+        # as an empty log, so read directly instead of checking existence first
+        if self._is_current_month(log_info.date_created):
+            return self.parser.parse_log_file(log_info.file_path)
+
         # Try the expected path first
         if log_info.file_path.exists():
             return self.parser.parse_log_file(log_info.file_path)
 
         # Fallback: if loading a past month log and file doesn't exist in year/month dir,
         # check if it's still in the base directory (hasn't been organized yet)
-        if not self._is_current_month(log_info.date_created):
-            base_dir = self._get_base_directory_from_log_info(log_info)
-            fallback_path = base_dir / log_info.file_path.name
-            if fallback_path.exists():
-                return self.parser.parse_log_file(fallback_path)
+        base_dir = self._get_base_directory_from_log_info(log_info)
+        fallback_path = base_dir / log_info.file_path.name
+        if fallback_path.exists():
+            return self.parser.parse_log_file(fallback_path)
 
         # File doesn't exist in either location, return empty log
-        return self.parser.parse_log_file(log_info.file_path)
+        return LogData()
 
     def save_log(self, log_info: LogFileInfo, log_data: LogData):
         """Save log data to file.
@@ -110,6 +122,61 @@ class LogManager:
         today = date.today()
         return log_date.year == today.year and log_date.month == today.month
 
+    def _load_organize_state(self) -> Dict[str, List[int]]:
+        """Load the persisted organize state, reading the file at most once.
+
+        Returns:
+            Mapping of base directory to the [year, month] it was organized in
+        """
+        if self._organize_state is None:
+            try:
+                with open(self.ORGANIZE_STATE_FILE, encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+            self._organize_state = state if isinstance(state, dict) else {}
+        return self._organize_state
+
+    def _was_organized_this_month(self, base_dir: Path) -> bool:
+        """Check if the base directory was already organized this month.
+
+        Args:
+            base_dir: Base directory for log files
+
+        Returns:
+            True if organization already ran this month, False otherwise
+        """
+        today = date.today()
+        state = self._load_organize_state()
+        return state.get(str(base_dir)) == [today.year, today.month]
+
+    def _mark_organized_this_month(self, base_dir: Path):
+        """Record that the base directory was organized this month.
+
+        The state file is written atomically through a per-process temp file,
+        so concurrent hook runs do not share one. Failing to write it only
+        means the next run scans the directory again.
+
+        Args:
+            base_dir: Base directory for log files
+        """
+        today = date.today()
+        state = self._load_organize_state()
+        state[str(base_dir)] = [today.year, today.month]
+
+        state_file = self.ORGANIZE_STATE_FILE
+        temp_file = state_file.with_name(f".{state_file.name}.{os.getpid()}.tmp")
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(temp_file, state_file)
+        except OSError as e:
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
+            print(f"Warning: Could not save organize state to {state_file}: {e}")
+
     def _get_base_directory(
         self, project: ProjectInfo, log_repo_path: Optional[Path] = None
     ) -> Path:
@@ -122,14 +189,29 @@ class LogManager:
         Returns:
             Path to the base directory
         """
-        if log_repo_path is None:
+        if log_repo_path is not None:
+            log_repo_path = resolved_path(log_repo_path)
+        return self._base_directory_for(project, log_repo_path)
+
+    def _base_directory_for(
+        self, project: ProjectInfo, resolved_log_repo_path: Optional[Path]
+    ) -> Path:
+        """Get the base directory for an already resolved log repository path.
+
+        Args:
+            project: Project information
+            resolved_log_repo_path: Resolved log repository path, or None
+
+        Returns:
+            Path to the base directory
+        """
+        if resolved_log_repo_path is None:
             return self.BASE_DIR / project.name
 
-        log_repo_path = log_repo_path.resolve()
-        if log_repo_path == self.config.global_log_repo:
-            return log_repo_path / project.name
+        if resolved_log_repo_path == self.config.global_log_repo:
+            return resolved_log_repo_path / project.name
         else:
-            return log_repo_path
+            return resolved_log_repo_path
 
     def _get_base_directory_from_log_info(self, log_info: LogFileInfo) -> Path:
         """Get the base directory from LogFileInfo.
@@ -168,39 +250,38 @@ class LogManager:
                 base_dir / str(log_date.year) / f"{log_date.month:02d}" / log_file_name
             )
 
-    def _has_old_files_in_main_directory(
-        self, project: ProjectInfo, log_repo_path: Optional[Path] = None
-    ) -> bool:
-        """Check if there are any old log files in the main directory that need organizing.
+    @staticmethod
+    def _parse_log_date(name: str) -> Optional[tuple[int, int]]:
+        """Extract the year and month from a ``YYYY.MM.DD.md`` file name.
 
         Args:
-            project: Project information
-            log_repo_path: Optional log repository path (for git repos)
+            name: File name to check
 
         Returns:
-            True if there are old files in the main directory, False otherwise
+            Tuple of (year, month), or None if the name is not a log file name
         """
-        base_dir = self._get_base_directory(project, log_repo_path)
-        if not base_dir.exists():
-            return False
+        if len(name) != 13 or not name.endswith(".md"):
+            return None
+        if name[4] != "." or name[7] != ".":
+            return None
 
-        today = date.today()
-        current_year = today.year
-        current_month = today.month
+        digits = name[:4] + name[5:7] + name[8:10]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
 
-        for file_path in base_dir.iterdir():
-            if not file_path.is_file():
-                continue
+        return int(name[:4]), int(name[5:7])
 
-            match = self.LOG_FILE_PATTERN.match(file_path.name)
-            if match:
-                file_year = int(match.group(1))
-                file_month = int(match.group(2))
+    def _has_old_files_in_main_directory(self, base_dir: Path) -> bool:
+        """Check if there are any old log files in the main directory that need organizing.
 
-                # Organize files from previous months (not current month)
-                if file_year != current_year or file_month != current_month:
-                    return True
+        Args:
+            base_dir: Base directory for log files
 
+        Returns:
+            True if there are old files in the main directory, False otherwise
+        """
+        for _ in self._scan_old_log_files(base_dir):
+            return True
         return False
 
     def _find_old_log_files(self, base_dir: Path) -> list[tuple[Path, int, int]]:
@@ -212,42 +293,51 @@ class LogManager:
         Returns:
             List of tuples (file_path, year, month) for files to move
         """
-        if not base_dir.exists():
-            return []
+        return [
+            (Path(entry.path), file_year, file_month)
+            for entry, file_year, file_month in self._scan_old_log_files(base_dir)
+        ]
 
-        today = date.today()
-        current_year = today.year
-        current_month = today.month
+    def _scan_old_log_files(
+        self, base_dir: Path
+    ) -> Iterator[tuple[os.DirEntry, int, int]]:
+        """Yield log files from previous months found directly in base_dir.
+
+        Uses os.scandir so the file type comes from the directory listing
+        itself and no extra stat call is made per entry.
 
-        files_to_move = []
-        for file_path in base_dir.iterdir():
-            if not file_path.is_file():
-                continue
+        Args:
+            base_dir: Base directory to search
 
-            match = self.LOG_FILE_PATTERN.match(file_path.name)
-            if match:
-                file_year = int(match.group(1))
-                file_month = int(match.group(2))
+        Yields:
+            Tuples (entry, year, month) for files to move
+        """
+        today = date.today()
+        current_month = (today.year, today.month)
 
-                # Organize files from previous months (not current month)
-                if file_year != current_year or file_month != current_month:
-                    files_to_move.append((file_path, file_year, file_month))
+        try:
+            entries = os.scandir(base_dir)
+        except FileNotFoundError:
+            return
 
-        return files_to_move
+        with entries:
+            for entry in entries:
+                log_month = self._parse_log_date(entry.name)
+                if log_month is None or log_month == current_month:
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    yield entry, log_month[0], log_month[1]
 
-    def _move_log_file_to_year_month(
-        self, file_path: Path, file_year: int, file_month: int, base_dir: Path
-    ) -> Optional[Path]:
-        """Move a log file to its year/month subdirectory.
+    def _move_log_file(self, file_path: Path, target_dir: Path) -> Optional[Path]:
+        """Move a log file into an existing year/month directory.
 
         Args:
             file_path: Path to the file to move
-            file_year: Year of the log file
-            file_month: Month of the log file
-            base_dir: Base directory for log files
+            target_dir: Year/month directory to move the file into
+
+        Returns:
+            The new path of the file, or None if it was not moved
         """
-        target_dir = base_dir / str(file_year) / f"{file_month:02d}"
-        target_dir.mkdir(parents=True, exist_ok=True)
         target_path = target_dir / file_path.name
 
         if not target_path.exists():
@@ -260,26 +350,22 @@ class LogManager:
 
         return None
 
-    def _organize_old_log_files(
-        self, project: ProjectInfo, log_repo_path: Optional[Path] = None
-    ):
+    def _organize_old_log_files(self, base_dir: Path):
         """Organize old log files into year/month directories.
 
         Moves all log files from previous months to year/month subdirectories.
         Only files from the current month remain in the main directory.
 
         Args:
-            project: Project information
-            log_repo_path: Optional log repository path (for git repos)
+            base_dir: Base directory for log files
         """
-        base_dir = self._get_base_directory(project, log_repo_path)
-        files_to_move = self._find_old_log_files(base_dir)
-
-        if not files_to_move:
-            return
-
-        # Move all files
-        for file_path, file_year, file_month in files_to_move:
-            self._move_log_file_to_year_month(
-                file_path, file_year, file_month, base_dir
-            )
+        # Group files by month so each target directory is created only once
+        files_by_month: Dict[tuple[int, int], List[Path]] = {}
+        for file_path, file_year, file_month in self._find_old_log_files(base_dir):
+            files_by_month.setdefault((file_year, file_month), []).append(file_path)
+
+        for (file_year, file_month), file_paths in files_by_month.items():
+            target_dir = base_dir / str(file_year) / f"{file_month:02d}"
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for file_path in file_paths:
+                self._move_log_file(file_path, target_dir)
@@ -1,10 +1,23 @@
 """Log file parsing functionality for Captain's Log."""
 
+import re
 from enum import Enum
 from pathlib import Path
 
 from src.logs.log_models import LogData
 
+# Matches the only lines the parser cares about, with surrounding whitespace
+# stripped: "# Section", "## subsection" and "- entry". Any other line is
+# skipped by the regex engine without a Python-level loop iteration.
+_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"## [^\S\n]*(?P<subsection>.*?\S)"
+    r"|(?P<title># .*?\S)"
+    r"|(?P<entry>- .*?\S)"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
 
 class Section(Enum):
     """Log file sections with their headers."""
@@ -17,26 +30,28 @@ class Section(Enum):
 class LogParser:
     """Handles parsing of markdown log files."""
 
-    @staticmethod
-    def parse_log_file(file_path: Path) -> LogData:
+    @classmethod
+    def parse_log_file(cls, file_path: Path) -> LogData:
         """Parse a markdown log file into structured data.
 
+        Reads the file and delegates to parse_log_content. A missing file is
+        an empty log.
+
         Args:
             file_path: Path to the log file
 
         Returns:
             LogData containing the parsed information
         """
-        if not file_path.exists():
-            return LogData()
-
         try:
             content = file_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return LogData()
         except (OSError, UnicodeDecodeError) as e:
             print(f"Warning: Could not read log file {file_path}: {e}")
             return LogData()
 
-        return LogParser.parse_log_content(content)
+        return cls.parse_log_content(content)
 
     @staticmethod
     def parse_log_content(content: str) -> LogData:
@@ -48,52 +63,40 @@ class LogParser:
         Returns:
             LogData containing the parsed information
         """
-        lines = content.splitlines()
         repos = {}
         what_broke = []
         what_next = {}
         current_section = None
-        current_repo = None
-        current_next_section = None
+        # List that entry lines are appended to, or None when they are ignored
+        current_entries = None
+
+        for match in _LINE_RE.finditer(content):
+            title, subsection, entry = match.group("title", "subsection", "entry")
 
-        for line in lines:
-            line_stripped = line.strip()
+            # Handle entry lines (- entry text)
+            if entry is not None:
+                if current_entries is not None:
+                    current_entries.append(entry)
 
             # Check for section headers
-            if line_stripped.startswith("# "):
-                if Section.WHAT_BROKE.value in line_stripped:
+            elif title is not None:
+                if Section.WHAT_BROKE.value in title:
                     current_section = Section.WHAT_BROKE
-                elif Section.WHAT_I_DID.value in line_stripped:
+                    current_entries = what_broke
+                elif Section.WHAT_I_DID.value in title:
                     current_section = Section.WHAT_I_DID
-                elif Section.WHAT_NEXT.value in line_stripped:
+                    current_entries = None
+                elif Section.WHAT_NEXT.value in title:
                     current_section = Section.WHAT_NEXT
+                    current_entries = None
                 else:
                     current_section = None  # Other sections, ignore
-                current_repo = None
-                current_next_section = None
-                continue
+                    current_entries = None
 
             # Handle subsection headers (## section-name)
-            if line_stripped.startswith("## "):
-                subsection = line_stripped[3:].strip()
-                if not subsection:
-                    continue
-
-                if current_section == Section.WHAT_I_DID:
-                    current_repo = subsection
-                    repos.setdefault(current_repo, [])
-                elif current_section == Section.WHAT_NEXT:
-                    current_next_section = subsection
-                    what_next.setdefault(current_next_section, [])
-                continue
-
-            # Handle entry lines (- entry text)
-            if line_stripped.startswith("- ") and line_stripped:
-                if current_section == Section.WHAT_BROKE:
-                    what_broke.append(line_stripped)
-                elif current_section == Section.WHAT_I_DID and current_repo:
-                    repos[current_repo].append(line_stripped)
-                elif current_section == Section.WHAT_NEXT and current_next_section:
-                    what_next[current_next_section].append(line_stripped)
+            elif current_section == Section.WHAT_I_DID:
+                current_entries = repos.setdefault(subsection, [])
+            elif current_section == Section.WHAT_NEXT:
+                current_entries = what_next.setdefault(subsection, [])
 
         return LogData(repos=repos, what_broke=what_broke, what_next=what_next)
@@ -1,5 +1,6 @@
 """Log file writing functionality for Captain's Log."""
 
+import os
 from pathlib import Path
 
 from src.entries.entry_processor import EntryProcessor
@@ -12,6 +13,8 @@ class LogWriter:
     # Default log file structure
     HEADER = "# What I did\n\n"
     FOOTER = "# Whats next\n\n\n# What Broke or Got Weird\n"
+    # Encoded once; only the variable part of a log is encoded per write
+    HEADER_B = HEADER.encode("utf-8")
 
     def __init__(self):
         """Initialize the log writer."""
@@ -28,54 +31,26 @@ class LogWriter:
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Create file with basic structure if it doesn't exist
-            if not file_path.exists():
-                with file_path.open("w", encoding="utf-8") as f:
-                    f.write(self.HEADER)
-                    f.write("\n\n")
-                    f.write(self.FOOTER)
-
-            # Read existing content to preserve footer
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
-                # If we can't read the file, start fresh
-                content = self.HEADER + "\n\n" + self.FOOTER
-
-            # Ensure we have proper structure
-            if "# What I did" not in content:
-                content = self.HEADER + "\n\n" + self.FOOTER
-
             # Organize repositories for output (What I did section)
             organized_repos = self.entry_processor.organize_repos_for_output(
                 log_data.repos
             )
 
-            # Generate content lines for "What I did" section
-            content_lines = []
-            for repo_name, entries in organized_repos.items():
-                if entries:  # Only include repos with entries
-                    content_lines.append(f"## {repo_name}")
-                    content_lines.extend(entries)
-                    content_lines.append("")  # Empty line after section
-
-            # Construct final content
-            what_i_did_content = (
-                "\n".join(content_lines).rstrip() if content_lines else ""
+            # "What I did" section: one block per repository with entries
+            what_i_did_content = "".join(
+                f"## {repo_name}\n" + "\n".join(entries) + "\n\n"
+                for repo_name, entries in organized_repos.items()
+                if entries
             )
 
-            # Build the complete log structure
-            new_content = self.HEADER
-            if what_i_did_content:
-                new_content += what_i_did_content + "\n\n"
-            else:
-                new_content += "\n"
+            # Build the complete log structure after the fixed header
+            parts = [what_i_did_content or "\n"]
 
             # Add the "Whats next" section with optional subsections
-            new_content += "# Whats next\n"
+            parts.append("# Whats next\n")
 
             if log_data.what_next:
-                new_content += "\n"
+                parts.append("\n")
 
                 # Custom sorting with 'other' at the end
                 what_next_sections = dict(log_data.what_next)
@@ -83,41 +58,64 @@ class LogWriter:
                 sorted_sections = sorted(
                     what_next_sections.items(), key=lambda x: x[0].lower()
                 )
+                if other_entries:
+                    sorted_sections.append(("other", other_entries))
 
                 for section_name, entries in sorted_sections:
-                    if not entries:
-                        continue
-                    new_content += f"## {section_name}\n"
-                    for entry in entries:
-                        new_content += entry + "\n"
-                    new_content += "\n"
-
-                if other_entries:
-                    new_content += "## other\n"
-                    for entry in other_entries:
-                        new_content += entry + "\n"
-                    new_content += "\n"
+                    if entries:
+                        parts.append(f"## {section_name}\n")
+                        parts.extend(entry + "\n" for entry in entries)
+                        parts.append("\n")
             else:
-                new_content += "\n\n"
+                parts.append("\n\n")
 
             # Add the "What Broke or Got Weird" section with flat list
-            new_content += "# What Broke or Got Weird\n"
-            if log_data.what_broke:
-                new_content += "\n"
-                for entry in log_data.what_broke:
-                    new_content += entry + "\n"
-            else:
-                new_content += "\n"
+            parts.append("# What Broke or Got Weird\n\n")
+            parts.extend(entry + "\n" for entry in log_data.what_broke)
+
+            new_bytes = self.HEADER_B + "".join(parts).encode("utf-8")
+
+            # Leave the file untouched when nothing changed, so the git
+            # working tree stays clean and no commit is attempted
+            try:
+                if file_path.read_bytes() == new_bytes:
+                    return
+            except OSError:
+                pass
 
             # Write atomically to avoid corruption
-            temp_file = file_path.with_suffix(file_path.suffix + ".tmp")
-            temp_file.write_text(new_content, encoding="utf-8")
-            temp_file.replace(file_path)
+            self._write_atomically(file_path, new_bytes)
 
         except Exception as e:
             print(f"Error saving log file {file_path}: {e}")
             raise
 
+    @staticmethod
+    def _write_atomically(file_path: Path, data: bytes):
+        """Write data to a hidden temp file and rename it over file_path.
+
+        The temp file is a dotfile named after the target and this process,
+        so a crash never leaves a visible ``.md.tmp`` next to the logs and
+        concurrent writers do not share a temp file. It is removed if
+        anything fails before the rename.
+
+        Args:
+            file_path: Path of the file to replace
+            data: Complete new file content
+        """
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
     def get_log_template(self) -> str:
         """Get the basic log file template.
 
@@ -0,0 +1,52 @@
+"""Shared pytest fixtures for Captain's Log tests."""
+
+import shutil
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import config_models
+from src.logs import LogManager
+
+
+@pytest.fixture(autouse=True)
+def isolated_organize_state(tmp_path_factory, monkeypatch):
+    """Keep the persisted organize state out of the real home directory."""
+    state_file = tmp_path_factory.mktemp("state") / ".organize_state.json"
+    monkeypatch.setattr(LogManager, "ORGANIZE_STATE_FILE", state_file)
+    return state_file
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory):
+    """Build the skeleton of a repository (just a ``.git`` directory) once."""
+    template = tmp_path_factory.mktemp("git_repo_template") / "repo"
+    (template / ".git").mkdir(parents=True)
+    return template
+
+
+@pytest.fixture
+def git_repo(git_repo_template, tmp_path):
+    """Give each test its own copy of the repository skeleton."""
+    repo_path = tmp_path / "repo"
+    shutil.copytree(git_repo_template, repo_path)
+    return repo_path
+
+
+@pytest.fixture
+def mock_subprocess_run(monkeypatch):
+    """Replace subprocess.run as seen by the git operations module."""
+    mock_run = MagicMock()
+    monkeypatch.setattr("src.git.git_operations.subprocess.run", mock_run)
+    return mock_run
+
+
+@pytest.fixture
+def resolved_path_cache():
+    """Start with an empty path resolution cache and empty it again afterwards.
+
+    Tests that mock Path.resolve must not leave mocked results cached.
+    """
+    config_models._resolved_absolute.cache_clear()
+    yield config_models._resolved_absolute
+    config_models._resolved_absolute.cache_clear()
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from datetime import date
 
 import pytest
@@ -74,11 +76,11 @@ def test_add_manual_entry_adds_and_commits(tmp_path, monkeypatch, capsys):
         def commit_and_push(self, message: str):
             recorded["git_message"] = message
 
-    monkeypatch.setattr(btw, "load_config", lambda: DummyConfig())
-    monkeypatch.setattr(btw, "ProjectFinder", DummyProjectFinder)
-    monkeypatch.setattr(btw, "LogManager", DummyLogManager)
-    monkeypatch.setattr(btw, "EntryProcessor", DummyEntryProcessor)
-    monkeypatch.setattr(btw, "GitOperations", DummyGitOperations)
+    monkeypatch.setattr("src.config.load_config", lambda: DummyConfig())
+    monkeypatch.setattr("src.projects.ProjectFinder", DummyProjectFinder)
+    monkeypatch.setattr("src.logs.LogManager", DummyLogManager)
+    monkeypatch.setattr("src.entries.EntryProcessor", DummyEntryProcessor)
+    monkeypatch.setattr("src.git.GitOperations", DummyGitOperations)
     monkeypatch.setattr(btw, "date", DummyDate)
 
     btw.add_manual_entry("Did a thing")
@@ -164,11 +166,11 @@ def test_add_manual_entry_duplicate_does_not_save_or_commit(
         def commit_and_push(self, message: str):
             recorded["git_message"] = message
 
-    monkeypatch.setattr(btw, "load_config", lambda: DummyConfig())
-    monkeypatch.setattr(btw, "ProjectFinder", DummyProjectFinder)
-    monkeypatch.setattr(btw, "LogManager", DummyLogManager)
-    monkeypatch.setattr(btw, "EntryProcessor", DummyEntryProcessor)
-    monkeypatch.setattr(btw, "GitOperations", DummyGitOperations)
+    monkeypatch.setattr("src.config.load_config", lambda: DummyConfig())
+    monkeypatch.setattr("src.projects.ProjectFinder", DummyProjectFinder)
+    monkeypatch.setattr("src.logs.LogManager", DummyLogManager)
+    monkeypatch.setattr("src.entries.EntryProcessor", DummyEntryProcessor)
+    monkeypatch.setattr("src.git.GitOperations", DummyGitOperations)
 
     btw.add_manual_entry("existing entry")
 
@@ -272,3 +274,16 @@ def test_main_handles_add_manual_entry_error(monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "Error adding entry: boom" in out
     assert exc.value.code == 1
+
+
+def test_importing_btw_does_not_load_domain_modules():
+    """Domain packages are only imported once an entry is actually added."""
+    code = (
+        "import sys, src.btw; "
+        "print(','.join(m for m in ('src.config', 'src.logs', 'src.git') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -1,5 +1,6 @@
 """Tests for the captains-log CLI."""
 
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -130,8 +131,6 @@ def test_setup_package_not_found_exits(monkeypatch, capsys, tmp_path):
 
 def test_setup_subprocess_error_exits(monkeypatch, capsys, tmp_path):
     """setup exits when git config fails (lines 115-117)."""
-    import subprocess
-
     monkeypatch.setattr(cli.Path, "home", lambda: tmp_path)
     (tmp_path / ".captains-log").mkdir(parents=True, exist_ok=True)
     (tmp_path / ".git-hooks").mkdir(parents=True, exist_ok=True)
@@ -165,8 +164,6 @@ def test_install_precommit_hooks_creates_hooks(monkeypatch, tmp_path, capsys):
 
 def test_install_precommit_hooks_subprocess_error_exits(monkeypatch, tmp_path):
     """install_precommit_hooks exits when git config fails (lines 231-233)."""
-    import subprocess
-
     monkeypatch.setattr(cli.Path, "home", lambda: tmp_path)
     monkeypatch.setattr(
         cli.subprocess,
@@ -3,8 +3,6 @@
 from pathlib import Path
 from unittest.mock import patch
 
-import yaml
-
 from src.config import Config, ConfigLoader, ProjectConfig
 
 
@@ -24,6 +22,24 @@ def test_project_config_from_dict_dict_format():
     assert config.log_repo == Path("/tmp/logs").resolve()
 
 
+def test_project_config_from_dict_memoizes_absolute_paths(
+    tmp_path, monkeypatch, resolved_path_cache
+):
+    """Absolute paths are resolved once; relative ones follow the cwd."""
+    with patch.object(Path, "resolve", autospec=True, return_value=tmp_path) as res:
+        ProjectConfig.from_dict("/tmp/memo-test")
+        ProjectConfig.from_dict({"root": "/tmp/memo-test"})
+    assert res.call_count == 1
+    resolved_path_cache.cache_clear()
+
+    monkeypatch.chdir(tmp_path)
+    first = ProjectConfig.from_dict("relative")
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path / "other")
+    second = ProjectConfig.from_dict("relative")
+    assert first.root != second.root
+
+
 def test_project_config_from_dict_empty():
     """Test creating ProjectConfig from None or empty."""
     config = ProjectConfig.from_dict(None)
@@ -79,11 +95,14 @@ def test_config_post_init_defaults_projects_to_empty():
 # ConfigLoader tests
 def test_config_loader_load_config_file_exists(tmp_path):
     """Test loading config from existing file."""
-    config_data = {"global_log_repo": "/tmp/logs", "projects": {"test": "/tmp/test"}}
     config_file = tmp_path / "config.yml"
-
-    with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+    config_file.write_text(
+        """\
+global_log_repo: /tmp/logs
+projects:
+  test: /tmp/test
+"""
+    )
 
     loader = ConfigLoader(config_file)
     config = loader.load_config()
@@ -102,6 +121,19 @@ def test_config_loader_load_config_file_not_exists(tmp_path):
     assert config.projects == {}
 
 
+def test_config_loader_rejects_unsafe_yaml_tags(tmp_path):
+    """The faster loader is still a safe loader: Python tags are not executed."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("global_log_repo: !!python/object/apply:os.getcwd []")
+
+    loader = ConfigLoader(config_file)
+    with patch("builtins.print") as mock_print:
+        config = loader.load_config()
+        mock_print.assert_called()
+
+    assert config.global_log_repo is None
+
+
 def test_config_loader_load_config_caching(tmp_path):
     """Test that config is cached properly."""
     config_file = tmp_path / "config.yml"
@@ -135,6 +167,64 @@ def test_config_loader_clear_cache(tmp_path):
     assert config1 is not config2
 
 
+def test_config_loader_reuses_json_sidecar_across_instances(tmp_path):
+    """A new loader (e.g. a new process) reads the sidecar instead of YAML."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("global_log_repo: /tmp/logs")
+
+    config1 = ConfigLoader(config_file).load_config()
+    assert (tmp_path / "config.yml.cache.json").exists()
+
+    with patch("src.config.config_loader.yaml.load") as mock_load:
+        config2 = ConfigLoader(config_file).load_config()
+        mock_load.assert_not_called()
+
+    assert config2.global_log_repo == config1.global_log_repo
+
+
+def test_config_loader_sidecar_invalidated_when_config_changes(tmp_path):
+    """Editing the config file makes the sidecar stale."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("global_log_repo: /tmp/logs")
+    ConfigLoader(config_file).load_config()
+
+    config_file.write_text("global_log_repo: /tmp/other-logs")
+    config = ConfigLoader(config_file).load_config()
+
+    assert config.global_log_repo == Path("/tmp/other-logs").resolve()
+
+
+def test_config_loader_skips_sidecar_for_non_string_keys(tmp_path):
+    """Int and bool YAML keys would come back as strings, so are not cached."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(
+        """\
+projects:
+  2024: /tmp/p2024
+  yes: /tmp/pyes
+"""
+    )
+
+    config1 = ConfigLoader(config_file).load_config()
+    config2 = ConfigLoader(config_file).load_config()
+
+    assert not (tmp_path / "config.yml.cache.json").exists()
+    assert list(config1.projects) == [2024, True]
+    assert list(config2.projects) == list(config1.projects)
+
+
+def test_config_loader_clear_cache_removes_sidecar(tmp_path):
+    """clear_cache drops the JSON sidecar as well."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("global_log_repo: /tmp/logs")
+
+    loader = ConfigLoader(config_file)
+    loader.load_config()
+    loader.clear_cache()
+
+    assert not loader.cache_path.exists()
+
+
 def test_config_loader_load_config_yaml_error(tmp_path):
     """Test handling of YAML parsing errors."""
     config_file = tmp_path / "config.yml"
@@ -1,5 +1,9 @@
 """Tests for the entries module."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from src.entries import CommitEntry, EntryFormatter, EntryProcessor, ManualEntry
 
 
@@ -14,6 +18,17 @@ def test_commit_entry_short_sha():
     assert entry_short.short_sha == "abc"
 
 
+def test_entries_are_immutable_and_hashable():
+    """Entries are frozen value objects, so they can be used in sets."""
+    entry = CommitEntry(sha="abc1234", message="Test", repo_name="test")
+    with pytest.raises(FrozenInstanceError):
+        entry.sha = "def5678"
+
+    duplicate = CommitEntry(sha="abc1234", message="Test", repo_name="test")
+    assert len({entry, duplicate}) == 1
+    assert len({ManualEntry(text="Test"), ManualEntry(text="Test")}) == 1
+
+
 def test_commit_entry_format():
     """Test formatting commit entry."""
     entry = CommitEntry(sha="abcdef1234567890", message="Test commit", repo_name="test")
@@ -37,6 +52,8 @@ def test_commit_entry_parse_invalid():
         "- Not a commit",
         "- (abc1234",  # Missing closing paren
         "- abc1234) Missing opening paren",
+        "- (abc1234)",  # No space before the message
+        "- (abc)1234) Text",  # First closing paren not followed by a space
     ]
 
     for invalid in invalid_entries:
@@ -54,6 +71,15 @@ def test_commit_entry_parse_empty_message():
     assert entry.message == ""
 
 
+def test_commit_entry_parse_message_with_parentheses():
+    """Only the first closing parenthesis ends the SHA."""
+    entry = CommitEntry.parse("- (abc1234) Fix parser (again) - really")
+
+    assert entry is not None
+    assert entry.sha == "abc1234"
+    assert entry.message == "Fix parser (again) - really"
+
+
 # ManualEntry tests
 def test_manual_entry_format():
     """Test formatting manual entry."""
@@ -182,6 +208,9 @@ def test_entry_processor_organize_repos_for_output_other_at_end():
     expected_order = ["alpha", "zebra", "other"]
     assert list(result.keys()) == expected_order
 
+    # The input is not modified, so "other" survives for later saves
+    assert list(repos.keys()) == ["zebra", "other", "alpha"]
+
 
 def test_entry_processor_organize_repos_for_output_no_other():
     """Test organizing repos when 'other' doesn't exist."""
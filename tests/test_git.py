@@ -1,8 +1,12 @@
 """Tests for the git module."""
 
+import os
+import shutil
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.git import CommitParser, GitOperations
 
 
@@ -17,7 +21,7 @@ def test_commit_parser_is_valid_commit_sha_valid():
 
 def test_commit_parser_is_valid_commit_sha_invalid():
     """Test invalid commit SHAs."""
-    invalid_shas = ["", "no-sha", "no-sha-merge", None]
+    invalid_shas = ["", "no-sha", "no-sha-merge", None, "abc 123", "0xabc123"]
 
     for sha in invalid_shas:
         assert CommitParser.is_valid_commit_sha(sha) is False
@@ -66,6 +70,24 @@ def test_commit_parser_should_skip_commit_valid():
 
 
 # GitOperations tests
+def _assert_added(mock_subprocess_run, repo_path, paths):
+    """Assert the last git call was the single add reading paths from stdin."""
+    mock_subprocess_run.assert_called_with(
+        [
+            "git",
+            "-C",
+            str(repo_path),
+            "add",
+            "--pathspec-from-file=-",
+            "--pathspec-file-nul",
+        ],
+        input=b"\0".join(os.fsencode(path) for path in paths),
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
 def test_git_operations_init(tmp_path):
     """Test GitOperations initialization."""
     repo_path = tmp_path / "repo"
@@ -73,52 +95,87 @@ def test_git_operations_init(tmp_path):
     assert git_ops.repo_path == repo_path
 
 
-@patch("subprocess.run")
-def test_git_operations_has_changes_true(mock_run, tmp_path):
+def test_git_operations_has_changes_true(mock_subprocess_run, tmp_path):
     """Test has_changes when changes exist."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
-    mock_run.return_value = MagicMock(stdout="M  file.txt")
+    mock_subprocess_run.return_value = MagicMock(stdout=b"M  file.txt\0")
     assert git_ops.has_changes() is True
 
 
-@patch("subprocess.run")
-def test_git_operations_has_changes_false(mock_run, tmp_path):
+def test_git_operations_has_changes_false(mock_subprocess_run, tmp_path):
     """Test has_changes when no changes exist."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
-    mock_run.return_value = MagicMock(stdout="")
+    mock_subprocess_run.return_value = MagicMock(stdout=b"")
+    assert git_ops.has_changes() is False
+
+
+def test_git_operations_status_is_cached_until_invalidated(
+    mock_subprocess_run, tmp_path
+):
+    """has_changes and add_all share one git status until it is invalidated."""
+    repo_path = tmp_path / "repo"
+    git_ops = GitOperations(repo_path)
+
+    mock_subprocess_run.return_value = MagicMock(stdout=b"M  file.txt\0")
+    assert git_ops.has_changes() is True
+    assert git_ops.has_changes() is True
+    assert mock_subprocess_run.call_count == 1
+
+    git_ops.invalidate_status()
+    mock_subprocess_run.return_value = MagicMock(stdout=b"")
+    assert git_ops.has_changes() is False
+    assert mock_subprocess_run.call_count == 2
+
+
+def test_git_operations_commit_invalidates_status(mock_subprocess_run, tmp_path):
+    """A successful commit drops the cached status."""
+    repo_path = tmp_path / "repo"
+    git_ops = GitOperations(repo_path)
+
+    mock_subprocess_run.return_value = MagicMock(stdout=b"M  file.md\0")
+    assert git_ops.has_changes() is True
+    assert git_ops.commit("Test commit") is True
+
+    mock_subprocess_run.return_value = MagicMock(stdout=b"")
     assert git_ops.has_changes() is False
 
 
-@patch("subprocess.run")
-def test_git_operations_has_changes_error(mock_run, tmp_path):
+def test_git_operations_has_changes_error(mock_subprocess_run, tmp_path):
     """Test has_changes when git command fails."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
-    mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    mock_subprocess_run.side_effect = subprocess.CalledProcessError(1, "git")
     assert git_ops.has_changes() is False
 
 
-def test_git_operations_has_lock_files_true(tmp_path):
+def test_git_operations_has_lock_files_true(git_repo):
     """Test has_lock_files when lock files exist."""
-    repo_path = tmp_path / "repo"
+    repo_path = git_repo
     git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
     (git_dir / "index.lock").write_text("")
 
     git_ops = GitOperations(repo_path)
     assert git_ops.has_lock_files() is True
 
 
-def test_git_operations_has_lock_files_false(tmp_path):
+def test_git_operations_has_lock_files_false(git_repo):
     """Test has_lock_files when no lock files exist."""
+    repo_path = git_repo
+
+    git_ops = GitOperations(repo_path)
+    assert git_ops.has_lock_files() is False
+
+
+def test_git_operations_has_lock_files_git_file(tmp_path):
+    """Test has_lock_files when .git is a file, as in linked worktrees."""
     repo_path = tmp_path / "repo"
-    git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
+    repo_path.mkdir()
+    (repo_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/repo")
 
     git_ops = GitOperations(repo_path)
     assert git_ops.has_lock_files() is False
@@ -133,8 +190,7 @@ def test_git_operations_has_lock_files_no_git_dir(tmp_path):
     assert git_ops.has_lock_files() is False
 
 
-@patch("subprocess.run")
-def test_git_operations_add_file_success(mock_run, tmp_path):
+def test_git_operations_add_file_success(mock_subprocess_run, tmp_path):
     """Test successful file addition."""
     repo_path = tmp_path / "repo"
     file_path = repo_path / "test.txt"
@@ -143,90 +199,79 @@ def test_git_operations_add_file_success(mock_run, tmp_path):
 
     git_ops = GitOperations(repo_path)
     assert git_ops.add_file(file_path) is True
-    mock_run.assert_called_once()
+    mock_subprocess_run.assert_called_once()
 
 
-@patch("subprocess.run")
-def test_git_operations_add_file_error(mock_run, tmp_path):
+def test_git_operations_add_file_error(mock_subprocess_run, tmp_path):
     """Test file addition error."""
     repo_path = tmp_path / "repo"
     file_path = repo_path / "test.txt"
 
-    mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    mock_subprocess_run.side_effect = subprocess.CalledProcessError(1, "git")
     git_ops = GitOperations(repo_path)
     assert git_ops.add_file(file_path) is False
 
 
-@patch("subprocess.run")
-def test_git_operations_commit_success(mock_run, tmp_path):
+def test_git_operations_commit_success(mock_subprocess_run, tmp_path):
     """Test successful commit."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
     assert git_ops.commit("Test commit") is True
-    mock_run.assert_called_once()
+    mock_subprocess_run.assert_called_once()
 
 
-@patch("subprocess.run")
-def test_git_operations_commit_error(mock_run, tmp_path):
+def test_git_operations_commit_error(mock_subprocess_run, tmp_path):
     """Test commit error."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
-    mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    mock_subprocess_run.side_effect = subprocess.CalledProcessError(1, "git")
     assert git_ops.commit("Test commit") is False
 
 
-@patch("subprocess.run")
-def test_git_operations_push_success(mock_run, tmp_path):
+def test_git_operations_push_success(mock_subprocess_run, tmp_path):
     """Test successful push."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
     assert git_ops.push() is True
-    mock_run.assert_called_once()
+    mock_subprocess_run.assert_called_once()
 
 
-@patch("subprocess.run")
-def test_git_operations_push_error(mock_run, tmp_path):
+def test_git_operations_push_error(mock_subprocess_run, tmp_path):
     """Test push error."""
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
-    mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    mock_subprocess_run.side_effect = subprocess.CalledProcessError(1, "git")
     assert git_ops.push() is False
 
 
-@patch("subprocess.run")
-def test_git_operations_commit_and_push_success(mock_run, tmp_path):
+def test_git_operations_commit_and_push_success(mock_subprocess_run, git_repo):
     """Test successful commit and push workflow."""
-    repo_path = tmp_path / "repo"
-    git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
+    repo_path = git_repo
 
-    file_path = repo_path / "test.txt"
+    file_path = repo_path / "test.md"
     file_path.write_text("test")
 
-    # Mock git operations: status, add_all, commit, push
-    mock_run.side_effect = [
-        MagicMock(stdout="M  test.txt"),  # status - has changes
-        MagicMock(),  # add_all
-        MagicMock(),  # commit
-        MagicMock(),  # push
+    # Mock git operations: status, then add, commit and push in one script
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b"M  test.md\0"),  # status - has changes
+        MagicMock(returncode=0),  # add, commit, push
     ]
 
     git_ops = GitOperations(repo_path)
     result = git_ops.commit_and_push("Test commit")
 
     assert result is True
-    assert mock_run.call_count == 4
+    assert mock_subprocess_run.call_count == 2
 
 
-def test_git_operations_commit_and_push_lock_files(tmp_path):
+def test_git_operations_commit_and_push_lock_files(git_repo):
     """Test commit and push with lock files present."""
-    repo_path = tmp_path / "repo"
+    repo_path = git_repo
     git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
     (git_dir / "index.lock").write_text("")
 
     git_ops = GitOperations(repo_path)
@@ -238,15 +283,12 @@ def test_git_operations_commit_and_push_lock_files(tmp_path):
         )
 
 
-@patch("subprocess.run")
-def test_git_operations_commit_and_push_no_changes(mock_run, tmp_path):
+def test_git_operations_commit_and_push_no_changes(mock_subprocess_run, git_repo):
     """Test commit and push when no changes exist."""
-    repo_path = tmp_path / "repo"
-    git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
+    repo_path = git_repo
 
     # Mock git status to show no changes
-    mock_run.return_value = MagicMock(stdout="")
+    mock_subprocess_run.return_value = MagicMock(stdout=b"")
 
     git_ops = GitOperations(repo_path)
     with patch("builtins.print") as mock_print:
@@ -255,73 +297,86 @@ def test_git_operations_commit_and_push_no_changes(mock_run, tmp_path):
         mock_print.assert_called_with("No changes to commit, skipping git operations")
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_success(mock_run, tmp_path):
+def test_git_operations_add_all_success(mock_subprocess_run, tmp_path):
     """Test successful add_all operation with .md files."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     git_ops = GitOperations(repo_path)
 
     # Mock git status to return .md files
-    # Files are now batched together in a single git add call
-    mock_run.side_effect = [
-        MagicMock(stdout="M  test.md\nA  new.md"),  # status
-        MagicMock(),  # batch add: test.md and new.md together
+    # Files are added together in a single git add call
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b"M  test.md\0A  new.md\0"),  # status
+        MagicMock(),  # add: test.md and new.md together
     ]
     assert git_ops.add_all() is True
-    assert mock_run.call_count == 2
+    assert mock_subprocess_run.call_count == 2
     # Verify status was called first
-    mock_run.assert_any_call(
-        ["git", "-C", str(repo_path), "status", "--porcelain"],
+    mock_subprocess_run.assert_any_call(
+        [
+            "git",
+            "-C",
+            str(repo_path),
+            "status",
+            "--porcelain=v1",
+            "-z",
+            "--untracked-files=all",
+        ],
         check=True,
         capture_output=True,
-        text=True,
     )
-    # Verify .md files were added in batch
-    add_calls = [call[0][0] for call in mock_run.call_args_list if "add" in call[0][0]]
-    assert len(add_calls) == 1, "Should batch add files together"
-    assert "test.md" in add_calls[0] and "new.md" in add_calls[0]
+    # Verify .md files were added together
+    _assert_added(mock_subprocess_run, repo_path, ["new.md", "test.md"])
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_error(mock_run, tmp_path):
+def test_git_operations_add_all_error(mock_subprocess_run, tmp_path):
     """Test add_all error handling."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     git_ops = GitOperations(repo_path)
 
     # Mock git status to fail
-    mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    mock_subprocess_run.side_effect = subprocess.CalledProcessError(1, "git")
     assert git_ops.add_all() is False
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_single_file_uses_individual_add(mock_run, tmp_path):
-    """add_all with a single .md path uses the individual-add branch."""
+def test_git_operations_add_all_single_file(mock_subprocess_run, tmp_path):
+    """add_all with a single .md path passes it to git add via stdin."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     git_ops = GitOperations(repo_path)
 
-    # First call: status; second call: individual git add
-    mock_run.side_effect = [
-        MagicMock(stdout="M  test.md"),
+    # First call: status; second call: git add
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b"M  test.md\0"),
         MagicMock(),  # git add test.md
     ]
 
     assert git_ops.add_all() is True
-    assert mock_run.call_count == 2
-    # Second call should be git add with single path
-    add_call_args = mock_run.call_args_list[1][0][0]
-    assert add_call_args[0:4] == ["git", "-C", str(repo_path), "add"]
-    assert "test.md" in add_call_args
+    assert mock_subprocess_run.call_count == 2
+    # Second call should be git add reading the path from stdin
+    _assert_added(mock_subprocess_run, repo_path, ["test.md"])
 
 
-@patch("subprocess.run")
-def test_git_operations_commit_and_push_uses_add_all(mock_run, tmp_path):
-    """Test that commit_and_push uses add_all() which filters to .md files."""
+def test_git_operations_add_all_many_files_single_call(mock_subprocess_run, tmp_path):
+    """add_all adds any number of files with exactly one git add."""
     repo_path = tmp_path / "repo"
-    git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
+    repo_path.mkdir()
+    git_ops = GitOperations(repo_path)
+
+    names = [f"2024.01.{day:02d}.md" for day in range(1, 32)] * 10
+    status = b"".join(f"?? {i:03d}-{name}\0".encode() for i, name in enumerate(names))
+    mock_subprocess_run.side_effect = [MagicMock(stdout=status), MagicMock()]
+
+    assert git_ops.add_all() is True
+    assert mock_subprocess_run.call_count == 2
+    expected = sorted(f"{i:03d}-{name}" for i, name in enumerate(names))
+    _assert_added(mock_subprocess_run, repo_path, expected)
+
+
+def test_git_operations_commit_and_push_uses_add_all(mock_subprocess_run, git_repo):
+    """Test that commit_and_push uses add_all() which filters to .md files."""
+    repo_path = git_repo
 
     # Create .md files to test add_all
     file1 = repo_path / "test1.md"
@@ -329,39 +384,33 @@ def test_git_operations_commit_and_push_uses_add_all(mock_run, tmp_path):
     file1.write_text("test1")
     file2.write_text("test2")
 
-    # Mock git operations: status (for has_changes), status (for add_all), batch add files, commit, push
-    mock_run.side_effect = [
-        MagicMock(stdout="M  test1.md\nM  test2.md"),  # status - has changes
-        MagicMock(stdout="M  test1.md\nM  test2.md"),  # status - for add_all
-        MagicMock(),  # batch add: test1.md and test2.md together
-        MagicMock(),  # commit
-        MagicMock(),  # push
+    # Mock git operations: status (shared by has_changes and the path
+    # filtering), then add, commit and push in one script
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b"M  test1.md\0M  test2.md\0M  notes.txt\0"),  # status
+        MagicMock(returncode=0),  # add, commit, push
     ]
 
     git_ops = GitOperations(repo_path)
     result = git_ops.commit_and_push("Test commit")
 
     assert result is True
-    assert mock_run.call_count == 5
+    assert mock_subprocess_run.call_count == 2
 
-    # Verify add_all filtered to .md files and batched them together
-    add_calls = [call[0][0] for call in mock_run.call_args_list if "add" in call[0][0]]
-    assert len(add_calls) == 1, "Should batch add both .md files together"
-    assert "test1.md" in add_calls[0] and "test2.md" in add_calls[0]
+    # Verify the paths were filtered to .md files and fed through stdin
+    batch_call = mock_subprocess_run.call_args_list[1]
+    assert batch_call[0][0][:2] == ["sh", "-c"]
+    assert batch_call[1]["input"].split(b"\0") == [b"test1.md", b"test2.md"]
 
 
-@patch("subprocess.run")
-def test_git_operations_commit_and_push_add_all_failure(mock_run, tmp_path):
+def test_git_operations_commit_and_push_add_all_failure(mock_subprocess_run, git_repo):
     """Test commit_and_push when add_all fails."""
-    repo_path = tmp_path / "repo"
-    git_dir = repo_path / ".git"
-    git_dir.mkdir(parents=True)
+    repo_path = git_repo
 
-    # Mock git operations: status succeeds (for has_changes), status succeeds (for add_all), add fails
-    mock_run.side_effect = [
-        MagicMock(stdout="M  test.md"),  # status - has changes
-        MagicMock(stdout="M  test.md"),  # status - for add_all
-        subprocess.CalledProcessError(1, "git add"),  # add fails
+    # Mock git operations: status succeeds, the add step of the script fails
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b"M  test.md\0"),  # status - has changes
+        MagicMock(returncode=3, stderr=b"fatal: add failed"),  # add fails
     ]
 
     git_ops = GitOperations(repo_path)
@@ -376,6 +425,8 @@ def test_git_operations_commit_and_push_add_all_returns_false(monkeypatch, tmp_p
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
+    # A repository object selects the step-by-step (pygit2) workflow
+    monkeypatch.setattr(git_ops, "repo", MagicMock())
     monkeypatch.setattr(git_ops, "has_lock_files", lambda: False)
     monkeypatch.setattr(git_ops, "has_changes", lambda: True)
     monkeypatch.setattr(git_ops, "add_all", lambda: False)
@@ -394,6 +445,8 @@ def test_git_operations_commit_and_push_commit_failure(monkeypatch, tmp_path):
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
+    # A repository object selects the step-by-step (pygit2) workflow
+    monkeypatch.setattr(git_ops, "repo", MagicMock())
     monkeypatch.setattr(git_ops, "has_lock_files", lambda: False)
     monkeypatch.setattr(git_ops, "has_changes", lambda: True)
     monkeypatch.setattr(git_ops, "add_all", lambda: True)
@@ -412,6 +465,8 @@ def test_git_operations_commit_and_push_push_failure(monkeypatch, tmp_path):
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
+    # A repository object selects the step-by-step (pygit2) workflow
+    monkeypatch.setattr(git_ops, "repo", MagicMock())
     monkeypatch.setattr(git_ops, "has_lock_files", lambda: False)
     monkeypatch.setattr(git_ops, "has_changes", lambda: True)
     monkeypatch.setattr(git_ops, "add_all", lambda: True)
@@ -430,6 +485,8 @@ def test_git_operations_commit_and_push_unexpected_exception(monkeypatch, tmp_pa
     repo_path = tmp_path / "repo"
     git_ops = GitOperations(repo_path)
 
+    # A repository object selects the step-by-step (pygit2) workflow
+    monkeypatch.setattr(git_ops, "repo", MagicMock())
     monkeypatch.setattr(git_ops, "has_lock_files", lambda: False)
     monkeypatch.setattr(git_ops, "has_changes", lambda: True)
 
@@ -449,35 +506,175 @@ def test_git_operations_commit_and_push_unexpected_exception(monkeypatch, tmp_pa
     assert "Unexpected error during git operations" in printed
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_filters_non_md_files(mock_run, tmp_path):
+@pytest.mark.parametrize(
+    "returncode, warning",
+    [
+        (4, "Warning: Failed to commit changes"),
+        (5, "Warning: Failed to push changes"),
+    ],
+)
+def test_git_operations_commit_and_push_batched_reports_failed_step(
+    mock_subprocess_run, returncode, warning, tmp_path
+):
+    """commit_and_push_batched maps the script exit code to the failing step."""
+    repo_path = tmp_path / "repo"
+    mock_subprocess_run.return_value = MagicMock(returncode=returncode, stderr=b"")
+
+    git_ops = GitOperations(repo_path)
+    with patch("builtins.print") as mock_print:
+        result = git_ops.commit_and_push_batched(["test.md"], "Test commit")
+
+    assert result is False
+    mock_print.assert_called_with(warning)
+
+
+def test_git_operations_commit_and_push_batched_passes_message_as_argument(
+    mock_subprocess_run, tmp_path
+):
+    """The message and repo path are script arguments, never part of the script."""
+    repo_path = tmp_path / "repo"
+    mock_subprocess_run.return_value = MagicMock(returncode=0)
+    message = "Fix $(rm -rf ~) \"quoted\" 'message'"
+
+    git_ops = GitOperations(repo_path)
+    assert git_ops.commit_and_push_batched([], message) is True
+
+    argv = mock_subprocess_run.call_args[0][0]
+    script = argv[2]
+    assert argv[3:] == ["sh", str(repo_path), message]
+    assert message not in script
+    # Nothing to stage, so the add step is left out
+    assert "add" not in script
+    assert mock_subprocess_run.call_args[1]["input"] == b""
+
+
+def _init_git_repo(repo_path, remote_path=None):
+    """Create a real repository (and optional bare remote) in one shell call.
+
+    The paths are passed as script arguments rather than formatted into it.
+    Hooks and commit signing are disabled so commits made by the code under
+    test never run the developer's global hooks (such as Captain's Log's
+    own commit-msg hook) or prompt for a signing key.
+    """
+    script = [
+        "set -e",
+        'git init -q "$1"',
+        'git -C "$1" config user.name "Test User"',
+        'git -C "$1" config user.email test@example.com',
+        'git -C "$1" config core.hooksPath /dev/null',
+        'git -C "$1" config commit.gpgsign false',
+    ]
+    if remote_path is not None:
+        script += [
+            'git init -q --bare "$2"',
+            'git -C "$1" remote add origin "$2"',
+            'git -C "$1" config push.default current',
+        ]
+    subprocess.run(
+        ["sh", "-c", "\n".join(script), "sh", str(repo_path), str(remote_path)],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_git_operations_commit_and_push_batched_real_repo(tmp_path):
+    """The batched script stages, commits and pushes to a real remote."""
+    remote_path = tmp_path / "remote.git"
+    repo_path = tmp_path / "repo"
+    _init_git_repo(repo_path, remote_path)
+    (repo_path / "2024.01.15.md").write_text("# Log")
+
+    git_ops = GitOperations(repo_path)
+    git_ops.repo = None
+    assert git_ops.commit_and_push_batched(["2024.01.15.md"], "Add log") is True
+
+    log = subprocess.run(
+        ["git", "-C", str(remote_path), "log", "--format=%s"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert log.stdout.strip() == "Add log"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_git_operations_session_stages_paths(tmp_path):
+    """Paths added during a session are staged when it is closed."""
+    repo_path = tmp_path / "repo"
+    _init_git_repo(repo_path)
+    (repo_path / "2024" / "01").mkdir(parents=True)
+    (repo_path / "2024" / "01" / "2024.01.15.md").write_text("# Log")
+    (repo_path / "2024.01.16.md").write_text("# Log")
+
+    git_ops = GitOperations(repo_path)
+    git_ops.open_session()
+    assert git_ops.add_path(repo_path / "2024" / "01" / "2024.01.15.md") is True
+    assert git_ops.add_path(repo_path / "2024.01.16.md") is True
+    assert git_ops.add_path(tmp_path / "outside.md") is False
+    assert git_ops.close() is True
+
+    staged = subprocess.run(
+        ["git", "-C", str(repo_path), "diff", "--cached", "--name-only"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert staged.stdout.split() == ["2024.01.16.md", "2024/01/2024.01.15.md"]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_git_operations_session_close_reports_failure(tmp_path, capsys):
+    """close returns False and prints git's error when update-index fails."""
+    repo_path = tmp_path / "repo"
+    _init_git_repo(repo_path)
+    (repo_path / "2024").mkdir()
+    (repo_path / "2024" / "2024.01.15.md").write_text("# Log")
+
+    git_ops = GitOperations(repo_path)
+    git_ops.open_session()
+    # update-index refuses directories and exits non-zero
+    assert git_ops.add_path(repo_path / "2024") is True
+    assert git_ops.close() is False
+
+    output = capsys.readouterr().out
+    assert "git update-index failed" in output
+    assert "is a directory" in output
+
+
+def test_git_operations_add_path_without_session(tmp_path):
+    """add_path refuses to stage when no session is open."""
+    repo_path = tmp_path / "repo"
+    git_ops = GitOperations(repo_path)
+
+    assert git_ops.add_path(repo_path / "test.md") is False
+    assert git_ops.close() is True
+
+
+def test_git_operations_add_all_filters_non_md_files(mock_subprocess_run, tmp_path):
     """Test that add_all only adds .md files and filters out other files."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     git_ops = GitOperations(repo_path)
 
     # Mock git status with mixed file types
-    mock_run.side_effect = [
+    mock_subprocess_run.side_effect = [
         MagicMock(
-            stdout="M  test.md\nM  config.txt\nA  readme.md\n??  script.py"
+            stdout=b"M  test.md\0M  config.txt\0A  readme.md\0?? script.py\0"
         ),  # status
-        MagicMock(),  # batch add: test.md and readme.md together
+        MagicMock(),  # add: test.md and readme.md together
     ]
     assert git_ops.add_all() is True
-    assert mock_run.call_count == 2
+    assert mock_subprocess_run.call_count == 2
 
-    # Verify only .md files were added (batched together)
-    add_calls = [call[0][0] for call in mock_run.call_args_list if "add" in call[0][0]]
-    assert len(add_calls) == 1, "Should batch add .md files together"
-    # Check that both .md files are in the batch add call
-    assert "test.md" in add_calls[0] and "readme.md" in add_calls[0]
-    # Verify non-.md files were NOT added
-    assert "config.txt" not in add_calls[0] and "script.py" not in add_calls[0]
+    # Verify only .md files were added; config.txt and script.py are skipped
+    _assert_added(mock_subprocess_run, repo_path, ["readme.md", "test.md"])
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_includes_directories_with_md_files(mock_run, tmp_path):
-    """Test that add_all includes directories containing .md files."""
+def test_git_operations_add_all_adds_md_files_in_new_directories(
+    mock_subprocess_run, tmp_path
+):
+    """Test that add_all adds .md files in untracked directories without walking."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     (repo_path / "2024").mkdir()
@@ -486,66 +683,174 @@ def test_git_operations_add_all_includes_directories_with_md_files(mock_run, tmp
 
     git_ops = GitOperations(repo_path)
 
-    # Mock git status showing new directory with .md file
-    # The code will add the file and all parent directories (2024/01 and 2024) in a batch
-    mock_run.side_effect = [
-        MagicMock(stdout="?? 2024/01/2024.01.15.md"),  # status
-        MagicMock(),  # batch add: 2024/01/2024.01.15.md, 2024/01, and 2024 together
+    # Mock git status showing new directory with .md file; untracked
+    # directories are expanded by git, so only the file is listed
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b"?? 2024/01/2024.01.15.md\0"),  # status
+        MagicMock(),  # add: 2024/01/2024.01.15.md
     ]
     assert git_ops.add_all() is True
 
-    # Verify file and directories were added in batch
-    add_calls = [call[0][0] for call in mock_run.call_args_list if "add" in call[0][0]]
-    assert len(add_calls) == 1, "Should batch add file and directories together"
-    assert "2024/01/2024.01.15.md" in add_calls[0]
-    assert "2024/01" in add_calls[0]
-    assert "2024" in add_calls[0]
+    # Only the file is added; git takes care of its parent directories
+    _assert_added(mock_subprocess_run, repo_path, ["2024/01/2024.01.15.md"])
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_parses_porcelain_paths_correctly(mock_run, tmp_path):
+def test_git_operations_add_all_parses_porcelain_paths_correctly(
+    mock_subprocess_run, tmp_path
+):
     """Test that add_all correctly parses status lines with leading space."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     git_ops = GitOperations(repo_path)
 
     # Simulate typical porcelain output with leading space before path
-    mock_run.side_effect = [
-        MagicMock(stdout=" M captains-log/2026.03.09.md\n"),  # status
-        MagicMock(),  # git add captains-log captains-log/2026.03.09.md (batch)
+    mock_subprocess_run.side_effect = [
+        MagicMock(stdout=b" M captains-log/2026.03.09.md\0"),  # status
+        MagicMock(),  # git add captains-log/2026.03.09.md
     ]
 
     assert git_ops.add_all() is True
-    assert mock_run.call_count == 2
+    assert mock_subprocess_run.call_count == 2
 
-    # Second call should be the git add batch command
-    add_call_args = mock_run.call_args_list[1][0][0]
-    # Expect: ["git", "-C", repo_path, "add", "captains-log", "captains-log/2026.03.09.md"]
-    assert add_call_args[0:4] == ["git", "-C", str(repo_path), "add"]
     # Ensure the full directory name is preserved (no missing leading 'c')
-    assert "captains-log" in add_call_args
-    assert "captains-log/2026.03.09.md" in add_call_args
+    _assert_added(mock_subprocess_run, repo_path, ["captains-log/2026.03.09.md"])
 
 
-@patch("subprocess.run")
-def test_git_operations_add_all_handles_file_moves(mock_run, tmp_path):
+def test_git_operations_add_all_handles_file_moves(mock_subprocess_run, tmp_path):
     """Test that add_all handles file moves (renames) correctly."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     git_ops = GitOperations(repo_path)
 
-    # Mock git status showing renamed file (R = renamed)
-    # The code will add old path, new path, and parent directories in a batch
-    mock_run.side_effect = [
-        MagicMock(stdout="R  2024.01.15.md -> 2024/01/2024.01.15.md"),  # status
-        MagicMock(),  # batch add: old path, new path, and directories together
+    # Mock git status showing renamed file (R = renamed); with -z the new
+    # path comes first and the old path follows as its own record
+    mock_subprocess_run.side_effect = [
+        MagicMock(
+            stdout=b"R  2024/01/2024.01.15.md\x002024.01.15.md\0 M 2024.01.16.md\0"
+        ),  # status
+        MagicMock(),  # add
+    ]
+    assert git_ops.add_all() is True
+
+    # The old path is already removed from the index, so only the new path
+    # is added; the record after the rename is still parsed normally
+    _assert_added(
+        mock_subprocess_run,
+        repo_path,
+        [
+            "2024.01.16.md",
+            "2024/01/2024.01.15.md",
+        ],
+    )
+
+
+def _init_pygit2_repo(repo_path):
+    """Create a real repository with a configured identity for pygit2 tests."""
+    pygit2 = pytest.importorskip("pygit2")
+    repo = pygit2.init_repository(str(repo_path))
+    repo.config["user.name"] = "Test User"
+    repo.config["user.email"] = "test@example.com"
+    return repo
+
+
+def test_git_operations_uses_pygit2_for_real_repo(tmp_path):
+    """A real repository is opened in-process when pygit2 is available."""
+    repo_path = tmp_path / "repo"
+    _init_pygit2_repo(repo_path)
+
+    git_ops = GitOperations(repo_path)
+    assert git_ops.repo is not None
+    assert git_ops.has_changes() is False
+
+    (repo_path / "2024.01.15.md").write_text("# Log")
+    assert git_ops.has_changes() is True
+
+
+def test_git_operations_pygit2_ignores_ignored_files(tmp_path):
+    """Ignored files never count as changes, whatever pygit2 reports."""
+    pygit2 = pytest.importorskip("pygit2")
+    repo_path = tmp_path / "repo"
+    _init_pygit2_repo(repo_path)
+
+    git_ops = GitOperations(repo_path)
+    # pygit2 before 1.15 includes ignored files in status()
+    git_ops.repo = MagicMock(wraps=git_ops.repo)
+    git_ops.repo.status.return_value = {"debug.md": pygit2.GIT_STATUS_IGNORED}
+
+    assert git_ops.has_changes() is False
+    assert git_ops.add_all() is True
+    assert "debug.md" not in git_ops.repo.index
+
+
+def test_git_operations_pygit2_add_all_and_commit(mock_subprocess_run, tmp_path):
+    """In-process add_all only stages .md files and commit records them."""
+    repo_path = tmp_path / "repo"
+    repo = _init_pygit2_repo(repo_path)
+    (repo_path / "2024" / "01").mkdir(parents=True)
+    (repo_path / "2024" / "01" / "2024.01.15.md").write_text("# Log")
+    (repo_path / "notes.txt").write_text("not a log")
+
+    git_ops = GitOperations(repo_path)
+    assert git_ops.add_all() is True
+    assert git_ops.commit("Add log") is True
+    mock_subprocess_run.assert_not_called()
+
+    head = repo[repo.head.target]
+    assert head.message == "Add log"
+    assert "2024/01/2024.01.15.md" in repo.index
+    assert "notes.txt" not in repo.index
+
+    # Nothing new is staged, so a second commit is refused like `git commit`
+    assert git_ops.commit("Empty") is False
+
+
+def test_git_operations_pygit2_add_all_stages_deletions(tmp_path):
+    """In-process add_all stages removed .md files (e.g. moved logs)."""
+    repo_path = tmp_path / "repo"
+    repo = _init_pygit2_repo(repo_path)
+    old_file = repo_path / "2024.01.15.md"
+    old_file.write_text("# Log")
+
+    git_ops = GitOperations(repo_path)
+    assert git_ops.add_all() is True
+    assert git_ops.commit("Add log") is True
+
+    (repo_path / "2024" / "01").mkdir(parents=True)
+    old_file.rename(repo_path / "2024" / "01" / "2024.01.15.md")
+
+    assert git_ops.add_all() is True
+    assert git_ops.commit("Organize logs") is True
+    assert "2024.01.15.md" not in repo.index
+    assert "2024/01/2024.01.15.md" in repo.index
+
+
+def test_git_operations_add_all_handles_unusual_file_names(
+    mock_subprocess_run, tmp_path
+):
+    """Paths are taken verbatim from -z records, without quoting or escapes."""
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    git_ops = GitOperations(repo_path)
+
+    mock_subprocess_run.side_effect = [
+        MagicMock(
+            stdout=(
+                b"?? notes -> old.md\0"
+                b"?? line\nbreak.md\0"
+                b'?? caf\xc3\xa9 "log".md\0'
+                b"?? not-a-log.md.txt\0"
+            )
+        ),
+        MagicMock(),  # git add
     ]
     assert git_ops.add_all() is True
 
-    # Verify both old and new paths were added, plus directories (batched)
-    add_calls = [call[0][0] for call in mock_run.call_args_list if "add" in call[0][0]]
-    assert len(add_calls) == 1, "Should batch add all paths together"
-    assert "2024.01.15.md" in add_calls[0]
-    assert "2024/01/2024.01.15.md" in add_calls[0]
-    assert "2024/01" in add_calls[0]
-    assert "2024" in add_calls[0]
+    _assert_added(
+        mock_subprocess_run,
+        repo_path,
+        [
+            'café "log".md',
+            "line\nbreak.md",
+            "notes -> old.md",
+        ],
+    )
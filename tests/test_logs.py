@@ -1,9 +1,12 @@
 """Tests for the logs module."""
 
+import os
 from datetime import date
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from src.config import Config, ProjectConfig
 from src.logs import LogData, LogFileInfo, LogManager, LogParser, LogWriter
 from src.projects import ProjectInfo
@@ -107,14 +110,17 @@ def test_log_file_info_exists_true(tmp_path):
 def test_log_parser_parse_log_file_not_exists(tmp_path):
     """Test parsing non-existent log file."""
     file_path = tmp_path / "nonexistent.md"
-    log_data = LogParser.parse_log_file(file_path)
+    with patch("builtins.print") as mock_print:
+        log_data = LogParser.parse_log_file(file_path)
 
     assert log_data.repos == {}
+    # A missing file is simply an empty log, not a read error
+    mock_print.assert_not_called()
 
 
 def test_log_parser_parse_log_file_with_content(tmp_path):
     """Test parsing log file with content."""
-    content = """# What I did
+    content = b"""# What I did
 
 ## repo1
 - (abc123) First commit
@@ -128,7 +134,7 @@ def test_log_parser_parse_log_file_with_content(tmp_path):
 # What Broke or Got Weird
 """
     file_path = tmp_path / "test.md"
-    file_path.write_text(content)
+    file_path.write_bytes(content)
 
     log_data = LogParser.parse_log_file(file_path)
     expected = {
@@ -208,6 +214,64 @@ def test_log_writer_write_log_file_new(tmp_path):
     assert "# What Broke or Got Weird" in content
 
 
+def test_log_writer_write_log_file_exact_content(tmp_path):
+    """The whole file is built from log data in one pass."""
+    file_path = tmp_path / "test.md"
+    log_data = LogData(
+        repos={"repo1": ["- (abc123) Test commit"], "other": ["- Manual entry"]},
+        what_next={"repo1": ["- Next step"]},
+        what_broke=["- Something broke"],
+    )
+
+    LogWriter().write_log_file(file_path, log_data)
+
+    assert file_path.read_text() == (
+        "# What I did\n\n"
+        "## repo1\n- (abc123) Test commit\n\n"
+        "## other\n- Manual entry\n\n"
+        "# Whats next\n\n"
+        "## repo1\n- Next step\n\n"
+        "# What Broke or Got Weird\n\n"
+        "- Something broke\n"
+    )
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+def test_log_writer_write_log_file_unchanged_content_is_not_rewritten(tmp_path):
+    """Saving identical content does not touch the file."""
+    file_path = tmp_path / "test.md"
+    log_data = LogData(repos={"repo1": ["- (abc123) Test commit"]})
+    writer = LogWriter()
+    writer.write_log_file(file_path, log_data)
+
+    with patch.object(LogWriter, "_write_atomically") as mock_write:
+        writer.write_log_file(file_path, log_data)
+
+    mock_write.assert_not_called()
+
+    # Changed content is still written
+    log_data.add_repo_entry("repo1", "- (def456) Another commit")
+    writer.write_log_file(file_path, log_data)
+    assert "- (def456) Another commit" in file_path.read_text()
+
+
+def test_log_writer_write_log_file_failed_write_leaves_no_temp_file(tmp_path):
+    """A failed save keeps the old file and removes the hidden temp file."""
+    file_path = tmp_path / "test.md"
+    writer = LogWriter()
+    writer.write_log_file(file_path, LogData(repos={"repo1": ["- (abc123) Old"]}))
+    original = file_path.read_bytes()
+
+    with patch("src.logs.log_writer.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            writer.write_log_file(
+                file_path, LogData(repos={"repo1": ["- (def456) New"]})
+            )
+
+    assert file_path.read_bytes() == original
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
 def test_log_writer_write_log_file_other_at_end(tmp_path):
     """Test writing with 'other' section at end."""
     file_path = tmp_path / "test.md"
@@ -248,11 +312,11 @@ def test_log_writer_write_log_file_existing_corrupted(tmp_path):
 
 
 def test_log_writer_write_log_file_handles_read_error(tmp_path):
-    """When existing file cannot be read (OSError/UnicodeDecodeError), writer starts fresh (lines 41-43)."""
+    """The writer rebuilds the whole file and never needs to read the old one."""
     file_path = tmp_path / "test.md"
     file_path.write_text("# What I did\n\n# Whats next\n\n# What Broke or Got Weird\n")
 
-    # Patch Path.read_text at the module level so the writer's read_text call raises
+    # Any attempt to read the existing file would raise
     with patch("pathlib.Path.read_text", side_effect=OSError("read failed")):
         log_data = LogData(repos={"repo1": ["- (abc123) Test"]})
         writer = LogWriter()
@@ -276,7 +340,27 @@ def test_log_writer_get_log_template():
 
 
 # LogManager tests
-def test_log_manager_get_log_file_info_global_repo():
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """Return a setter that fixes date.today() as seen by log_manager."""
+    from src.logs import log_manager
+
+    today = [date.today()]
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today[0]
+
+    monkeypatch.setattr(log_manager, "date", FrozenDate)
+
+    def set_today(value):
+        today[0] = value
+
+    return set_today
+
+
+def test_log_manager_get_log_file_info_global_repo(frozen_today):
     """Test getting log file info with global repository."""
     config = Config.from_dict({"global_log_repo": "/tmp/global-logs"})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -286,9 +370,8 @@ def test_log_manager_get_log_file_info_global_repo():
 
     manager = LogManager(config)
 
-    with patch("src.logs.log_manager.date") as mock_date:
-        mock_date.today.return_value = date(2024, 1, 15)
-        log_info = manager.get_log_file_info(project)
+    frozen_today(date(2024, 1, 15))
+    log_info = manager.get_log_file_info(project)
 
     assert log_info.log_repo_path == Path("/tmp/global-logs").resolve()
     assert log_info.file_path.name == "2024.01.15.md"
@@ -296,7 +379,27 @@ def test_log_manager_get_log_file_info_global_repo():
     assert log_info.has_git_repo is True
 
 
-def test_log_manager_get_log_file_info_project_specific():
+def test_log_manager_get_log_file_info_resolves_log_repo_once(resolved_path_cache):
+    """The log repository path is resolved once, then reused across lookups."""
+    config = Config.from_dict({"global_log_repo": "/tmp/global-logs"})
+    resolved_path_cache.cache_clear()
+    project_config = ProjectConfig(root=Path("/tmp/project"))
+    project = ProjectInfo(
+        name="test-project", config=project_config, base_dir=Path("/tmp/project")
+    )
+
+    manager = LogManager(config)
+
+    resolve = patch.object(Path, "resolve", autospec=True, side_effect=lambda p: p)
+    with resolve as mock_resolve:
+        manager.get_log_file_info(project)
+        log_info = manager.get_log_file_info(project)
+
+    assert mock_resolve.call_count == 1
+    assert log_info.file_path.parent == log_info.log_repo_path / "test-project"
+
+
+def test_log_manager_get_log_file_info_project_specific(frozen_today):
     """Test getting log file info with project-specific repository."""
     config = Config.from_dict({})
     project_config = ProjectConfig(
@@ -308,9 +411,8 @@ def test_log_manager_get_log_file_info_project_specific():
 
     manager = LogManager(config)
 
-    with patch("src.logs.log_manager.date") as mock_date:
-        mock_date.today.return_value = date(2024, 1, 15)
-        log_info = manager.get_log_file_info(project)
+    frozen_today(date(2024, 1, 15))
+    log_info = manager.get_log_file_info(project)
 
     assert log_info.log_repo_path == Path("/tmp/project-logs").resolve()
     assert log_info.file_path.name == "2024.01.15.md"
@@ -318,7 +420,7 @@ def test_log_manager_get_log_file_info_project_specific():
     assert log_info.has_git_repo is True
 
 
-def test_log_manager_get_log_file_info_no_repo():
+def test_log_manager_get_log_file_info_no_repo(frozen_today):
     """Test getting log file info with no repository."""
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -328,9 +430,8 @@ def test_log_manager_get_log_file_info_no_repo():
 
     manager = LogManager(config)
 
-    with patch("src.logs.log_manager.date") as mock_date:
-        mock_date.today.return_value = date(2024, 1, 15)
-        log_info = manager.get_log_file_info(project)
+    frozen_today(date(2024, 1, 15))
+    log_info = manager.get_log_file_info(project)
 
     assert log_info.log_repo_path is None
     assert log_info.file_path.name == "2024.01.15.md"
@@ -338,15 +439,24 @@ def test_log_manager_get_log_file_info_no_repo():
     assert log_info.has_git_repo is False
 
 
-def test_log_manager_load_log(tmp_path):
+@pytest.fixture(scope="module")
+def default_manager():
+    """LogManager with an empty config, shared by load/save tests.
+
+    Only for tests that do not organize directories: the manager caches the
+    organize state it has read.
+    """
+    return LogManager(Config.from_dict({}))
+
+
+def test_log_manager_load_log(default_manager, tmp_path):
     """Test loading log through manager."""
-    config = Config.from_dict({})
-    manager = LogManager(config)
+    manager = default_manager
 
     # Create test log file
     log_file = tmp_path / "test.md"
-    log_file.write_text(
-        """# What I did
+    log_file.write_bytes(
+        b"""# What I did
 
 ## test-repo
 - (abc123) Test commit
@@ -364,10 +474,24 @@ def test_log_manager_load_log(tmp_path):
     assert log_data.repos == {"test-repo": ["- (abc123) Test commit"]}
 
 
-def test_log_manager_save_log(tmp_path):
+def test_log_manager_load_log_current_month_reads_directly(default_manager, tmp_path):
+    """A current-month log is read without an existence check first."""
+    log_info = LogFileInfo(
+        file_path=tmp_path / "missing.md",
+        log_repo_path=None,
+        project_name="test",
+        date_created=date.today(),
+    )
+
+    with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+        log_data = default_manager.load_log(log_info)
+
+    assert log_data.repos == {}
+
+
+def test_log_manager_save_log(default_manager, tmp_path):
     """Test saving log through manager."""
-    config = Config.from_dict({})
-    manager = LogManager(config)
+    manager = default_manager
 
     log_file = tmp_path / "test.md"
     log_info = LogFileInfo(
@@ -386,7 +510,7 @@ def test_log_manager_save_log(tmp_path):
     assert "- (abc123) Test commit" in content
 
 
-def test_log_manager_get_log_file_info_past_month(tmp_path):
+def test_log_manager_get_log_file_info_past_month(frozen_today, tmp_path):
     """Test getting log file info for past month uses year/month subdirectory."""
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -397,9 +521,8 @@ def test_log_manager_get_log_file_info_past_month(tmp_path):
     manager = LogManager(config)
 
     # Mock today as 2024-03-15, request log for 2024-02-10 (past month)
-    with patch("src.logs.log_manager.date") as mock_date:
-        mock_date.today.return_value = date(2024, 3, 15)
-        log_info = manager.get_log_file_info(project, log_date=date(2024, 2, 10))
+    frozen_today(date(2024, 3, 15))
+    log_info = manager.get_log_file_info(project, log_date=date(2024, 2, 10))
 
     assert log_info.file_path.name == "2024.02.10.md"
     # Should be in year/month subdirectory
@@ -410,7 +533,7 @@ def test_log_manager_get_log_file_info_past_month(tmp_path):
     )
 
 
-def test_log_manager_get_log_file_info_current_month(tmp_path):
+def test_log_manager_get_log_file_info_current_month(frozen_today, tmp_path):
     """Test getting log file info for current month stays in base directory."""
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -421,16 +544,33 @@ def test_log_manager_get_log_file_info_current_month(tmp_path):
     manager = LogManager(config)
 
     # Mock today as 2024-03-15, request log for same date (current month)
-    with patch("src.logs.log_manager.date") as mock_date:
-        mock_date.today.return_value = date(2024, 3, 15)
-        log_info = manager.get_log_file_info(project, log_date=date(2024, 3, 15))
+    frozen_today(date(2024, 3, 15))
+    log_info = manager.get_log_file_info(project, log_date=date(2024, 3, 15))
 
     assert log_info.file_path.name == "2024.03.15.md"
     # Should be in base directory, not in year/month subdirectory
     assert log_info.file_path.parent == LogManager.BASE_DIR / "test-project"
 
 
-def test_log_manager_organize_old_files(tmp_path):
+def test_log_manager_parse_log_date():
+    """Only strict YYYY.MM.DD.md names yield a (year, month) tuple."""
+    assert LogManager._parse_log_date("2024.01.15.md") == (2024, 1)
+    assert LogManager._parse_log_date("1999.12.31.md") == (1999, 12)
+
+    for name in [
+        "2024.01.15.md.tmp",
+        "2024.1.15.md",
+        "2024-01-15.md",
+        "2024.01.15.txt",
+        "abcd.01.15.md",
+        "2024.01.1x.md",
+        "README.md",
+        "2024",
+    ]:
+        assert LogManager._parse_log_date(name) is None
+
+
+def test_log_manager_organize_old_files(frozen_today, tmp_path):
     """Test that old log files are moved to year/month directories."""
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -455,10 +595,8 @@ def test_log_manager_organize_old_files(tmp_path):
     manager = LogManager(config)
 
     # Mock today as 2024-03-15 and patch BASE_DIR to use tmp_path
-    with patch("src.logs.log_manager.date") as mock_date, patch.object(
-        LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"
-    ):
-        mock_date.today.return_value = date(2024, 3, 15)
+    with patch.object(LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"):
+        frozen_today(date(2024, 3, 15))
         # Trigger organization by getting log file info for current month
         manager.get_log_file_info(project)
 
@@ -472,10 +610,9 @@ def test_log_manager_organize_old_files(tmp_path):
     assert current_file.exists()
 
 
-def test_log_manager_load_log_fallback(tmp_path):
+def test_log_manager_load_log_fallback(default_manager, tmp_path):
     """Test loading log with fallback to old location."""
-    config = Config.from_dict({})
-    manager = LogManager(config)
+    manager = default_manager
 
     # Mock BASE_DIR to point to tmp_path
     base_dir = tmp_path / ".captains-log" / "projects" / "test-project"
@@ -506,7 +643,7 @@ def test_log_manager_load_log_fallback(tmp_path):
         assert log_data.repos == {"test-repo": ["- (abc123) Test commit"]}
 
 
-def test_log_manager_organize_multiple_months(tmp_path):
+def test_log_manager_organize_multiple_months(frozen_today, tmp_path):
     """Test organizing log files from multiple past months."""
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -544,10 +681,8 @@ def test_log_manager_organize_multiple_months(tmp_path):
     manager = LogManager(config)
 
     # Mock today as 2025-03-15 and patch BASE_DIR to use tmp_path
-    with patch("src.logs.log_manager.date") as mock_date, patch.object(
-        LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"
-    ):
-        mock_date.today.return_value = date(2025, 3, 15)
+    with patch.object(LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"):
+        frozen_today(date(2025, 3, 15))
         # Trigger organization by getting log file info for current month
         manager.get_log_file_info(project)
 
@@ -575,11 +710,12 @@ def test_log_manager_organize_multiple_months(tmp_path):
     assert current_file.exists()
 
 
-def test_log_manager_organize_old_files_when_present(tmp_path):
-    """Test that old files in main directory are always organized.
+def test_log_manager_organize_old_files_when_present(frozen_today, tmp_path):
+    """Test that old files in main directory are organized on the first run.
 
-    This test ensures that old files in the main directory are organized
-    whenever they are detected, regardless of when organization last ran.
+    Organization runs at most once per month per log directory. Files from
+    previous months are archived on the first lookup of the month that finds
+    them; files dropped in later that month wait for next month's first run.
     """
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -600,10 +736,8 @@ def test_log_manager_organize_old_files_when_present(tmp_path):
     manager = LogManager(config)
 
     # Mock today as 2024-03-15 and patch BASE_DIR to use tmp_path
-    with patch("src.logs.log_manager.date") as mock_date, patch.object(
-        LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"
-    ):
-        mock_date.today.return_value = date(2024, 3, 15)
+    with patch.object(LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"):
+        frozen_today(date(2024, 3, 15))
         # Access current month - this should trigger organization
         manager.get_log_file_info(project)
 
@@ -614,7 +748,7 @@ def test_log_manager_organize_old_files_when_present(tmp_path):
     assert (base_dir / "2024" / "02" / "2024.02.20.md").exists()
 
 
-def test_log_manager_organize_does_not_commit(tmp_path):
+def test_log_manager_organize_does_not_commit(frozen_today, tmp_path):
     """Test that organization does not trigger git operations."""
     config = Config.from_dict({})
     project_config = ProjectConfig(root=Path("/tmp/project"))
@@ -635,10 +769,10 @@ def test_log_manager_organize_does_not_commit(tmp_path):
     manager = LogManager(config)
 
     # Mock today as 2024-03-15 and patch BASE_DIR to use tmp_path
-    with patch("src.logs.log_manager.date") as mock_date, patch.object(
+    with patch.object(
         LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"
     ), patch("src.git.git_operations.GitOperations") as mock_git_ops_class:
-        mock_date.today.return_value = date(2024, 3, 15)
+        frozen_today(date(2024, 3, 15))
         # Access current month - this should trigger organization
         manager.get_log_file_info(project)
 
@@ -650,3 +784,90 @@ def test_log_manager_organize_does_not_commit(tmp_path):
     assert not old_file2.exists()
     assert (base_dir / "2024" / "01" / "2024.01.15.md").exists()
     assert (base_dir / "2024" / "02" / "2024.02.20.md").exists()
+
+
+def test_log_manager_organize_runs_once_per_month(
+    frozen_today, tmp_path, isolated_organize_state
+):
+    """Organization state persists across LogManager instances until the month changes."""
+    config = Config.from_dict({})
+    project_config = ProjectConfig(root=Path("/tmp/project"))
+    project = ProjectInfo(
+        name="test-project", config=project_config, base_dir=tmp_path / "test-project"
+    )
+
+    base_dir = tmp_path / ".captains-log" / "projects" / "test-project"
+    base_dir.mkdir(parents=True)
+
+    with patch.object(LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"):
+        frozen_today(date(2024, 3, 15))
+        LogManager(config).get_log_file_info(project)
+        assert isolated_organize_state.exists()
+
+        # A file from a previous month appearing later in the same month is
+        # not picked up, because the directory was already organized
+        late_file = base_dir / "2024.01.15.md"
+        late_file.write_text("# Old log")
+        with patch.object(LogManager, "_has_old_files_in_main_directory") as mock_scan:
+            LogManager(config).get_log_file_info(project)
+        mock_scan.assert_not_called()
+        assert late_file.exists()
+
+        # Next month the directory is scanned and organized again
+        frozen_today(date(2024, 4, 1))
+        LogManager(config).get_log_file_info(project)
+
+    assert not late_file.exists()
+    assert (base_dir / "2024" / "01" / "2024.01.15.md").exists()
+
+
+def test_log_manager_organize_state_uses_per_process_temp_file(
+    frozen_today, tmp_path, isolated_organize_state
+):
+    """The state file is written via a temp file named after this process."""
+    config = Config.from_dict({})
+    project_config = ProjectConfig(root=Path("/tmp/project"))
+    project = ProjectInfo(
+        name="test-project", config=project_config, base_dir=tmp_path / "test-project"
+    )
+    (tmp_path / ".captains-log" / "projects" / "test-project").mkdir(parents=True)
+
+    replaced = []
+    real_replace = os.replace
+
+    def record_replace(src, dst):
+        replaced.append(Path(src).name)
+        real_replace(src, dst)
+
+    with patch.object(LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"):
+        frozen_today(date(2024, 3, 15))
+        with patch("src.logs.log_manager.os.replace", side_effect=record_replace):
+            LogManager(config).get_log_file_info(project)
+
+    assert replaced == [f".{isolated_organize_state.name}.{os.getpid()}.tmp"]
+    assert [p.name for p in isolated_organize_state.parent.iterdir()] == [
+        isolated_organize_state.name
+    ]
+
+
+def test_log_manager_organize_state_ignores_corrupt_file(
+    frozen_today, tmp_path, isolated_organize_state
+):
+    """A corrupt state file is ignored and replaced."""
+    isolated_organize_state.write_text("not json")
+    config = Config.from_dict({})
+    project_config = ProjectConfig(root=Path("/tmp/project"))
+    project = ProjectInfo(
+        name="test-project", config=project_config, base_dir=tmp_path / "test-project"
+    )
+
+    base_dir = tmp_path / ".captains-log" / "projects" / "test-project"
+    base_dir.mkdir(parents=True)
+    (base_dir / "2024.01.15.md").write_text("# Old log")
+
+    with patch.object(LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"):
+        frozen_today(date(2024, 3, 15))
+        LogManager(config).get_log_file_info(project)
+
+    assert (base_dir / "2024" / "01" / "2024.01.15.md").exists()
+    assert isolated_organize_state.read_text().startswith("{")
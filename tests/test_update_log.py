@@ -1,5 +1,6 @@
 import subprocess
 import sys
+from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +8,8 @@ import pytest
 import yaml
 
 import update_log
+from src import update_log as update_log_src
+from src.config.config_loader import set_config_path
 
 
 # Test find_project function
@@ -278,17 +281,15 @@ def test_commit_and_push_success(mock_run, tmp_path):
     file_path = log_repo_path / "test.md"  # Make sure file is inside repo
     file_path.write_text("test content")
 
-    # Mock git status to show changes
+    # Mock git status to show changes, then add, commit and push in one script
     mock_run.side_effect = [
-        MagicMock(stdout="M  test.md"),  # status
-        MagicMock(),  # add
-        MagicMock(),  # commit
-        MagicMock(),  # push
+        MagicMock(stdout=b"M  test.md\0"),  # status
+        MagicMock(returncode=0),  # add, commit, push
     ]
 
     update_log.commit_and_push(log_repo_path, "Test commit")
 
-    assert mock_run.call_count == 4
+    assert mock_run.call_count == 2
 
 
 @patch("subprocess.run")
@@ -302,7 +303,7 @@ def test_commit_and_push_no_changes(mock_run, tmp_path):
     file_path.write_text("test content")
 
     # Mock git status to show no changes
-    mock_run.return_value = MagicMock(stdout="")
+    mock_run.return_value = MagicMock(stdout=b"")
 
     with patch("builtins.print") as mock_print:
         update_log.commit_and_push(log_repo_path, "Test commit")
@@ -372,8 +373,6 @@ def test_full_workflow(tmp_path):
 
     with patch("update_log.CONFIG_FILE", config_file):
         # Ensure the config loader uses our temporary config file
-        from src.config.config_loader import set_config_path
-
         set_config_path(config_file)
 
         # Test the full workflow
@@ -401,8 +400,6 @@ def test_full_workflow(tmp_path):
 @patch("subprocess.run")
 def test_update_log_commit_uses_add_all(mock_run, tmp_path):
     """Test that commit_and_push uses add_all() to stage all changes."""
-    import yaml
-
     # Create a git repository
     log_repo_path = tmp_path / "log-repo"
     log_repo_path.mkdir()
@@ -426,32 +423,20 @@ def test_update_log_commit_uses_add_all(mock_run, tmp_path):
     base_dir.mkdir(parents=True)
 
     # Create current month log file
-    from datetime import date
-
     today = date.today()
     current_file = base_dir / f"{today.year}.{today.month:02d}.{today.day:02d}.md"
     current_file.write_text("# Current log\n## test-repo\n")
 
     # Mock git operations:
-    # - status (for has_changes check)
-    # - status (for add_all to get changes)
-    # - add .md file(s)
-    # - commit
-    # - push
+    # - status (shared by has_changes and the .md path filtering)
+    # - one script that adds the .md file(s), commits and pushes
     file_name = current_file.name
     mock_run.side_effect = [
-        MagicMock(
-            stdout=f"M  {file_name}"
-        ),  # status - has changes (for has_changes check)
-        MagicMock(stdout=f"M  {file_name}"),  # status - for add_all to get changes
-        MagicMock(),  # add .md file
-        MagicMock(),  # commit
-        MagicMock(),  # push
+        MagicMock(stdout=f"M  {file_name}\0".encode()),  # status - has changes
+        MagicMock(returncode=0),  # add, commit, push
     ]
 
     # Patch sys.argv and config loading
-    from src.config.config_loader import set_config_path
-
     with patch.object(
         update_log.LogManager, "BASE_DIR", tmp_path / ".captains-log" / "projects"
     ), patch(
@@ -470,29 +455,25 @@ def test_update_log_commit_uses_add_all(mock_run, tmp_path):
         update_log.main()
 
     # Verify git operations were called
-    # add_all now calls: status (to get changes), then adds individual .md files
+    # add_all reuses the status, then adds the .md files in one git add
     all_calls = [call[0][0] for call in mock_run.call_args_list]
 
-    # Verify add_all was called - it should add .md files individually (not add -A)
-    add_calls = [
-        call for call in all_calls if "add" in call and call[-1].endswith(".md")
-    ]
-    assert len(add_calls) > 0, (
-        f"add_all should have added .md files. Calls: {all_calls}"
-    )
+    # Verify add_all was called - it should add .md files explicitly (not add -A)
+    batch_calls = [call for call in mock_run.call_args_list if call[0][0][0] == "sh"]
+    assert len(batch_calls) == 1, f"Expected one batched git script. Calls: {all_calls}"
+    argv = batch_calls[0][0][0]
+    script = argv[2]
 
-    # Verify commit was called (commit has format: ['git', '-C', path, 'commit', '-m', 'message'])
-    commit_found = any(
-        len(call) >= 4 and call[0] == "git" and call[1] == "-C" and call[3] == "commit"
-        for call in all_calls
+    # Verify the .md files were added explicitly (not add -A)
+    assert batch_calls[0][1]["input"] == file_name.encode(), (
+        f"add should have added .md files. Calls: {all_calls}"
     )
-    assert commit_found, f"commit should have been called. Calls: {all_calls}"
+    assert "add --pathspec-from-file=-" in script
 
-    # Verify push was called
-    push_found = any(
-        call == ["git", "-C", str(log_repo_path), "push"] for call in all_calls
-    )
-    assert push_found, f"push should have been called. Calls: {all_calls}"
+    # Verify commit and push were chained in the same script
+    assert 'commit -m "$2"' in script
+    assert 'git -C "$1" push' in script
+    assert argv[4] == str(log_repo_path)
 
 
 def test_load_config_legacy_uses_load_config(monkeypatch):
@@ -564,8 +545,6 @@ def test_main_handles_exception_and_exits_zero(monkeypatch, capsys):
 
 def test_main_version_flag_prints_version_and_exits(monkeypatch, capsys):
     """update_log --version prints version and exits with code 0 (uses src package)."""
-    from src import update_log as update_log_src
-
     monkeypatch.setattr(update_log_src.sys, "argv", ["update_log", "--version"])
 
     with pytest.raises(SystemExit) as exc:
@@ -578,7 +557,6 @@ def test_main_version_flag_prints_version_and_exits(monkeypatch, capsys):
 
 def test_main_accepts_log_level_and_updates_log(monkeypatch, capsys):
     """update_log supports --log-level and still processes positional args."""
-    from src import update_log as update_log_src
 
     class DummyConfig:
         def __init__(self) -> None: